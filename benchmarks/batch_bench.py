@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Benchmark drawing the wires, component leads, and node dots of a
+large schematic, a grid of components each with two leads, a wire, and
+a node dot.  This reports the number of artists and the time to add
+the artists, render the canvas, and clear the axes.
+
+The lines and dots are drawn as separate artists (as before they were
+batched) and with the shared collections.
+
+Usage: batch_bench [--components N] [--repeat N]
+"""
+
+import sys
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.pyplot import subplots
+from lcapygui.ui.tk.sketcher import Sketcher
+from benchutils import make_parser, best_times, format_times, timed
+
+
+class ArtistSketcher(Sketcher):
+    """Sketcher that draws a separate artist for each line and dot."""
+
+    def stroke_segment(self, xstart, ystart, xend, yend, **kwargs):
+
+        line, = self.stroke_line(xstart, ystart, xend, yend, **kwargs)
+        return line
+
+    def stroke_node(self, x, y, radius=0.5, color='black', port=False):
+
+        if port:
+            return self.stroke_donut(x, y, radius, color=color, alpha=1)
+        return self.stroke_filled_circle(x, y, radius, color=color, alpha=1)
+
+
+def redraw(ax, sketcher, ncomponents, columns):
+
+    def add():
+        for m in range(ncomponents):
+            x = 4 * (m % columns)
+            y = 4 * (m // columns)
+            # Leads either side of a component body and a wire to the
+            # next row.
+            sketcher.stroke_segment(x, y, x + 1, y, color='black', lw=1.5)
+            sketcher.stroke_segment(x + 3, y, x + 4, y, color='black',
+                                    lw=1.5)
+            sketcher.stroke_segment(x, y, x, y + 4, color='black', lw=1.5)
+            sketcher.stroke_node(x, y, 0.1, color='black',
+                                 port=m % 10 == 0)
+
+    # Clearing the axes resets the limits.
+    ax.set_xlim(-4, 4 * columns)
+    ax.set_ylim(-4, 4 * columns)
+
+    times = {}
+    times['add'], _ = timed(add)
+    times['render'], _ = timed(ax.figure.canvas.draw)
+    nartists = len(ax.get_children())
+    times['clear'], _ = timed(sketcher.clear)
+    return times, nartists
+
+
+def main(argv=None):
+
+    parser = make_parser(__doc__)
+    parser.add_argument('--components', type=int, default=1000,
+                        help='number of components to draw')
+
+    args = parser.parse_args(argv)
+
+    columns = int(args.components ** 0.5) + 1
+
+    fig, ax = subplots(figsize=(10, 10))
+
+    variants = {'artists': ArtistSketcher(ax),
+                'batched': Sketcher(ax)}
+
+    print('Redrawing %d components, %d times' % (args.components,
+                                                 args.repeat))
+    for name, sketcher in variants.items():
+        times, nartists = best_times(
+            lambda: redraw(ax, sketcher, args.components, columns),
+            args.repeat)
+        print('%-8s %5d artists  %s' % (name, nartists, format_times(times)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
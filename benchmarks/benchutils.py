@@ -0,0 +1,52 @@
+"""
+This defines the argument parsing and timing shared by the benchmark
+scripts.  Each benchmark has a function that runs it once and returns a
+dict of the times for each stage, in seconds, and a count of what was
+drawn or parsed.
+"""
+
+from argparse import ArgumentParser
+from time import perf_counter
+
+
+def make_parser(doc, repeat=5):
+    """Return an argument parser with a --repeat option.  The
+    description is the first paragraph of the docstring `doc`."""
+
+    parser = ArgumentParser(description=doc.strip().split('\n\n')[0])
+    parser.add_argument('--repeat', type=int, default=repeat,
+                        help='number of timed runs')
+    return parser
+
+
+def timed(func, *args, **kwargs):
+    """Return the time to call `func` and its result."""
+
+    t0 = perf_counter()
+    result = func(*args, **kwargs)
+    return perf_counter() - t0, result
+
+
+def best_times(run, repeat):
+    """Call `run` `repeat` times and return the smallest time for each
+    stage and the count from the last run.  `run` is called once more
+    beforehand without being timed since the first run includes one-off
+    costs."""
+
+    run()
+
+    best = None
+    for m in range(repeat):
+        times, count = run()
+        if best is None:
+            best = times
+        else:
+            best = {stage: min(t, times[stage]) for stage, t in best.items()}
+    return best, count
+
+
+def format_times(times):
+
+    parts = ['%s %7.1f ms' % (stage, t * 1e3) for stage, t in times.items()]
+    parts.append('total %7.1f ms' % (sum(times.values()) * 1e3))
+    return '  '.join(parts)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Benchmark redrawing a schematic of many components, cycling through
+the bundled sketches.  This reports the time to add the artists, render
+the canvas, and clear the axes.
+
+The sketches are drawn with one patch per path (as before the sketch
+paths were merged) and with the merged compound paths.
+
+Usage: redraw_bench [--components N] [--style STYLE] [--repeat N]
+"""
+
+import sys
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.pyplot import subplots
+from lcapygui.core.sketch import Sketch
+from lcapygui.core.tf import TF
+from lcapygui.sketch_library import SketchLibrary
+from lcapygui.ui.tk.sketcher import Sketcher
+from benchutils import make_parser, best_times, format_times, timed
+
+
+class PerPathSketch(Sketch):
+    """Sketch drawn with a patch for each path."""
+
+    @property
+    def compound_paths(self):
+
+        return [(spath.path, spath.fill) for spath in self.paths]
+
+
+def redraw(ax, sketches, columns):
+
+    sketcher = Sketcher(ax)
+
+    def add():
+        for m, sketch in enumerate(sketches):
+            tf = TF().translate(150 * (m % columns), 150 * (m // columns))
+            sketcher.sketch(sketch, tf, color='black', lw=1.5)
+
+    times = {}
+    times['add'], _ = timed(add)
+    times['render'], _ = timed(ax.figure.canvas.draw)
+    npatches = len(ax.patches)
+    times['clear'], _ = timed(sketcher.clear)
+    return times, npatches
+
+
+def main(argv=None):
+
+    parser = make_parser(__doc__)
+    parser.add_argument('--components', type=int, default=500,
+                        help='number of components to draw')
+    parser.add_argument('--style', type=str, default='american',
+                        help='drawing style')
+
+    args = parser.parse_args(argv)
+
+    library = SketchLibrary()
+    keys = library.sketch_keys(args.style)
+    sketches = []
+    for sketch_key in keys:
+        sketch = library.lookup(sketch_key, args.style)
+        if sketch is not None:
+            sketches.append(sketch)
+
+    sketches = [sketches[m % len(sketches)] for m in range(args.components)]
+    columns = int(args.components ** 0.5) + 1
+
+    fig, ax = subplots(figsize=(10, 10))
+    ax.set_xlim(-150, 150 * columns)
+    ax.set_ylim(-150, 150 * columns)
+
+    variants = {'per-path': [PerPathSketch(sketch.paths, sketch.width,
+                                           sketch.height)
+                             for sketch in sketches],
+                'compound': sketches}
+
+    print('Redrawing %d components, %d times' % (args.components,
+                                                 args.repeat))
+    for name, variant in variants.items():
+        times, npatches = best_times(lambda: redraw(ax, variant, columns),
+                                     args.repeat)
+        print('%-9s %5d patches  %s' % (name, npatches, format_times(times)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
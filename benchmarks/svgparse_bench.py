@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Benchmark the SVGParse backends by parsing all the bundled sketch
+SVG files with each backend and reporting the parse times.  The
+backends are checked for equivalence by lcapygui/tests/test_svgparse.py.
+
+Usage: svgparse_bench [--repeat N]
+"""
+
+import sys
+from lcapygui import __datadir__
+from lcapygui.core.svgparse import SVGParse
+from benchutils import make_parser, best_times, format_times, timed
+
+
+def parse(filenames, backend):
+
+    time = 0
+    for filename in filenames:
+        dt, svg = timed(SVGParse, str(filename), backend=backend)
+        time += dt
+    return {'parse': time}, len(filenames)
+
+
+def main(argv=None):
+
+    parser = make_parser(__doc__, repeat=3)
+    args = parser.parse_args(argv)
+
+    filenames = sorted((__datadir__ / 'svg').glob('*/*.svg'))
+
+    print('Parsing %d files, %d times' % (len(filenames), args.repeat))
+    for backend in SVGParse.backends:
+        times, nfiles = best_times(lambda: parse(filenames, backend),
+                                   args.repeat)
+        print('%-8s %s  %6.3f ms/file' %
+              (backend, format_times(times), 1e3 * times['parse'] / nfiles))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -24,6 +24,11 @@ class Bipole(Stretchy):
             s += ', style=' + self.style
         return s
 
+    @property
+    def outline_segments(self):
+
+        return [((self.node1.x, self.node1.y), (self.node2.x, self.node2.y))]
+
     def assign_positions(self, x1, y1, x2, y2) -> array:
         """Assign node positions based on cursor positions."""
 
@@ -2,6 +2,7 @@
 Defines the components that lcapy-gui can draw
 """
 
+from ..core.picture import Picture
 from ..core.pin import Pin
 from ..core.pins import Pins
 from ..core.pos import Pos
@@ -87,6 +88,10 @@ class Component(ABC):
         self.control = None
         self.attrs = ''
         self.annotations = []
+        self.node_markers = []
+        # This is called with the component when its transform is
+        # changed so that the model can update its index of the pins.
+        self.on_transform_change = None
         self.label = ''
         self.alabel = ''
         self.voltage_label = ''
@@ -156,8 +161,11 @@ class Component(ABC):
         # we don't care about.
         self.attrs = ', '.join(parts)
 
-        # This is set by the draw() method
+        # These are set by the draw() method
         self.picture = None
+        self.sketch = None
+        self.sketch_patches = None
+        self.sketch_tf = None
 
         # Items to be shown on right click
         self.menu_items = ['edit_cut', 'edit_copy', 'edit_paste',
@@ -246,12 +254,102 @@ class Component(ABC):
         style = model.preferences.style
 
         sketch = ui.sketchlib.lookup(self.sketch_key, style)
+        # Remember the sketch used so that restyle() can tell if
+        # the style has changed.
+        self.sketch = sketch
         return sketch
 
     def draw(self, model, **kwargs):
 
         raise NotImplementedError('TODO')
 
+    def draw_outline(self, model, **kwargs):
+        """Draw the outline of the component rather than its sketch.
+        This is used when zoomed so far out that the sketch would be
+        only a few pixels in size."""
+
+        # The sketch patches of an earlier full drawing are no longer
+        # drawn so there is nothing for restyle() to change.
+        self.forget_drawn()
+
+        kwargs = self.make_kwargs(model, **kwargs)
+        if 'invisible' in kwargs or 'nodraw' in kwargs or 'ignore' in kwargs:
+            return
+
+        kwargs.pop('mirror', False)
+        kwargs.pop('invert', False)
+
+        sketcher = model.ui.sketcher
+
+        self.picture = Picture()
+        for (x1, y1), (x2, y2) in self.outline_segments:
+            self.picture.add(sketcher.stroke_segment(x1, y1, x2, y2,
+                                                     **kwargs))
+
+    @property
+    def outline_segments(self):
+        """List of line segments ((x1, y1), (x2, y2)) for the outline
+        of the component."""
+
+        bbox_path = getattr(self, 'bbox_path', ())
+        if bbox_path == ():
+            points = [(node.pos.x, node.pos.y) for node in self.nodes
+                      if node.pos is not None]
+            return list(zip(points[:-1], points[1:]))
+
+        points = [tuple(point) for point in
+                  self.tf.transform(array(bbox_path))]
+        return list(zip(points, points[1:] + points[:1]))
+
+    def restyle(self, model):
+        """Change the drawn sketch to the sketch for the current drawing
+        style, reusing the existing patches.  This returns False if the
+        component needs to be redrawn instead."""
+
+        if self.sketch_patches is None:
+            # Nothing drawn from a sketch.
+            return True
+
+        drawn = self.sketch
+        sketch = self._sketch_lookup(model)
+        if sketch is drawn:
+            return True
+        if sketch is None:
+            return False
+
+        return sketch.redraw(model, self.sketch_patches, self.sketch_tf,
+                             self.mirror, self.invert)
+
+    def translate(self, model, dx, dy):
+        """Move the drawn artists, including the labels, by `dx` and `dy`
+        after the nodes have been moved by the same amount.  This is
+        used while dragging; the component is redrawn when the drag
+        finishes.  This returns False if the component needs to be
+        redrawn instead."""
+
+        if self.picture is None:
+            return False
+
+        patches = self.sketch_patches or []
+        artists = [artist for artist in self.picture
+                   if not any(artist is patch for patch in patches)]
+        artists.extend(ann.patch for ann in self.annotations
+                       if ann.patch is not None)
+        artists.extend(self.node_markers)
+
+        sketcher = model.ui.sketcher
+        if not sketcher.translate(artists, dx, dy):
+            return False
+
+        # The transform depends on the node positions.
+        self.update()
+
+        if patches != []:
+            tf = TF(self.sketch_tf.get_matrix().copy()).translate(dx, dy)
+            self.sketch.move(model, patches, tf)
+            self.sketch_tf = tf
+        return True
+
     def _line_width_to_lw(self, model, line_width):
         """Return line width as a float for use with matplotlib."""
 
@@ -501,13 +599,14 @@ class Component(ABC):
         return sqrt(rsq)
 
     def is_within_bbox(self, x, y):
-        tf = self.tf.inverted()
 
-        xb, yb = tf.transform((x, y))
+        # This is called for each component near the mouse as it
+        # moves so the transform is applied without numpy.
+        a, b, c, d, e, f = self.inverse_tf_values
+        xb = a * x + b * y + c
+        yb = d * x + e * y + f
 
-        path = array(self.bbox_path) * 0.7
-
-        return point_in_polygon(xb, yb, path)
+        return point_in_polygon(xb, yb, self.hit_path)
 
     def netitem_nodes(self, node_names):
         parts = []
@@ -574,12 +673,57 @@ class Component(ABC):
         return self.make_tf(self.node1.pos, self.node2.pos,
                             self.pos1, self.pos2)
 
+    @cached_property
+    def inverse_tf_values(self):
+        """Coefficients (a, b, c, d, e, f) of the transform from
+        schematic coordinates (x, y) to component coordinates
+        (a * x + b * y + c, d * x + e * y + f)."""
+
+        (a, b, c), (d, e, f), _ = self.tf.inverted().get_matrix()
+        return float(a), float(b), float(c), float(d), float(e), float(f)
+
+    @cached_property
+    def hit_path(self):
+        """Path in component coordinates within which the component is
+        selected."""
+
+        return tuple((0.7 * x, 0.7 * y) for x, y in self.bbox_path)
+
+    @cached_property
+    def extent(self):
+        """Bounding box (xmin, ymin, xmax, ymax) of the nodes and the
+        body of the component, or None if the node positions are not
+        known.  This does not include the labels."""
+
+        points = [(node.pos.x, node.pos.y) for node in self.nodes
+                  if node.pos is not None]
+        if points == []:
+            return None
+
+        bbox_path = getattr(self, 'bbox_path', ())
+        if bbox_path != ():
+            try:
+                points.extend(self.tf.transform(array(bbox_path)))
+            except (AttributeError, IndexError, TypeError, ValueError):
+                pass
+
+        xs, ys = zip(*points)
+        return min(xs), min(ys), max(xs), max(ys)
+
     def _clear_caches(self):
 
         try:
             del self.tf
         except AttributeError:
             pass
+        try:
+            del self.inverse_tf_values
+        except AttributeError:
+            pass
+        try:
+            del self.extent
+        except AttributeError:
+            pass
         try:
             del self.relative_pins
         except AttributeError:
@@ -589,6 +733,9 @@ class Component(ABC):
         except AttributeError:
             pass
 
+        if self.on_transform_change is not None:
+            self.on_transform_change(self)
+
     def undraw(self):
 
         # This is called when nodes are moved.
@@ -596,9 +743,24 @@ class Component(ABC):
 
         if self.picture is not None:
             self.picture.remove()
+        self.sketch_patches = None
         for ann in self.annotations:
             ann.remove()
         self.annotations = []
+        for marker in self.node_markers:
+            marker.remove()
+        self.node_markers = []
+
+    def forget_drawn(self):
+        """Forget the drawn artists without removing them, say after
+        the axes have been cleared."""
+
+        self.picture = None
+        self.sketch = None
+        self.sketch_patches = None
+        self.sketch_tf = None
+        self.annotations = []
+        self.node_markers = []
 
     @property
     def pins(self):
@@ -1,4 +1,5 @@
 from .bipole import Bipole
+from .component import Component
 from ..core.picture import Picture
 from ..core.tf import TF
 from math import cos, sin, radians, sqrt
@@ -50,12 +51,19 @@ class Connection(Bipole):
             x2, y2, angle = self.split_node_pos(x1, y1, model)
             offset = x2, y2
 
-        tf = TF().rotate_deg(angle).translate(*offset)
+        self.sketch_tf = TF().rotate_deg(angle).translate(*offset)
         sketcher = model.ui.sketcher
 
         self.picture = Picture()
-        self.picture.add(sketch.draw(model, tf, **kwargs))
-        self.picture.add(sketcher.stroke_line(x1, y1, x2, y2, **kwargs))
+        self.sketch_patches = sketch.draw(model, self.sketch_tf, **kwargs)
+        self.picture.add(self.sketch_patches)
+        self.picture.add(sketcher.stroke_segment(x1, y1, x2, y2, **kwargs))
+
+    def restyle(self, model):
+
+        # Unlike other bipoles, the line does not depend on the sketch
+        # size, so only the sketch needs changing.
+        return Component.restyle(self, model)
 
     def split_node_pos(self, x, y, model, flip=False):
 
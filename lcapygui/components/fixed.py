@@ -36,5 +36,6 @@ class Fixed(Component):
 
         self.picture = Picture()
         sketch = self._sketch_lookup(model)
-        tf = self.tf
-        self.picture.add(sketch.draw(model, tf, **kwargs))
+        self.sketch_tf = self.tf
+        self.sketch_patches = sketch.draw(model, self.sketch_tf, **kwargs)
+        self.picture.add(self.sketch_patches)
@@ -8,21 +8,11 @@ class Stretchy(Component):
 
     can_stretch = True
 
-    def draw(self, model, **kwargs):
-        """
-        Handles drawing specific features of components.
-        """
-
-        sketch = self._sketch_lookup(model)
-
-        # Handle ports where nothing is drawn.
-        if sketch is None or self.type == 'P':
-            return
-
-        kwargs = self.make_kwargs(model, **kwargs)
-
-        if 'invisible' in kwargs or 'nodraw' in kwargs or 'ignore' in kwargs:
-            return
+    def _sketch_ends(self, model, sketch):
+        """Return the node positions, the positions of the ends of the
+        sketch, and the transform for the sketch.  The sketch is drawn
+        between the ends and leads are drawn from the nodes to the
+        ends."""
 
         x1, y1 = self.node1.x, self.node1.y
         x2, y2 = self.node2.x, self.node2.y
@@ -30,10 +20,6 @@ class Stretchy(Component):
         dy = y2 - y1
 
         r = self.length
-        if r == 0:
-            model.ui.show_warning_dialog(
-                'Ignoring zero size component ' + self.name)
-            return
 
         # This scales the component size but not the distance between
         # the nodes (default 1)
@@ -57,12 +43,38 @@ class Stretchy(Component):
             p1p = p1
             p2p = p2
 
-        sketcher = model.ui.sketcher
-
         tf = self.make_tf(p1p, p2p, self.pos1, self.pos2)
+        return p1, p1p, p2p, p2, tf
 
+    def draw(self, model, **kwargs):
+        """
+        Handles drawing specific features of components.
+        """
+
+        sketch = self._sketch_lookup(model)
+
+        # Handle ports where nothing is drawn.
+        if sketch is None or self.type == 'P':
+            return
+
+        kwargs = self.make_kwargs(model, **kwargs)
+
+        if 'invisible' in kwargs or 'nodraw' in kwargs or 'ignore' in kwargs:
+            return
+
+        if self.length == 0:
+            model.ui.show_warning_dialog(
+                'Ignoring zero size component ' + self.name)
+            return
+
+        p1, p1p, p2p, p2, tf = self._sketch_ends(model, sketch)
+
+        sketcher = model.ui.sketcher
+
+        self.sketch_tf = tf
         self.picture = Picture()
-        self.picture.add(sketch.draw(model, tf, **kwargs))
+        self.sketch_patches = sketch.draw(model, tf, **kwargs)
+        self.picture.add(self.sketch_patches)
 
         # TODO: generalize
         kwargs.pop('mirror', False)
@@ -74,12 +86,15 @@ class Stretchy(Component):
         linestyle1 = linestyle2 = kwargs.pop('linestyle', 'solid')
         if len(self.node1.connected) < 2 and model.closest_node(self.node1.pos.x, self.node1.pos.y, ignore=self.node1) is not None:
             linestyle1 = (0, (3, 5, 1, 5, 1, 5))
-        self.picture.add(sketcher.stroke_line(*p1.xy, *p1p.xy,
-                                              linestyle=linestyle1, **kwargs))
+        lead1 = sketcher.stroke_segment(*p1.xy, *p1p.xy,
+                                        linestyle=linestyle1, **kwargs)
+        self.picture.add(lead1)
         if len(self.node2.connected) < 2 and model.closest_node(self.node2.pos.x, self.node2.pos.y, ignore=self.node2) is not None:
             linestyle2 = (0, (3, 5, 1, 5, 1, 5))
-        self.picture.add(sketcher.stroke_line(*p2p.xy, *p2.xy,
-                                              linestyle=linestyle2, **kwargs))
+        lead2 = sketcher.stroke_segment(*p2p.xy, *p2.xy,
+                                        linestyle=linestyle2, **kwargs)
+        self.picture.add(lead2)
+        self.leads = [lead1, lead2]
 
         # TODO, add label, voltage_label, current_label, flow_label
 
@@ -88,3 +103,30 @@ class Stretchy(Component):
             path = tf.transform(self.bbox_path)
             self.picture.add(sketcher.stroke_path(path, color='green',
                                                   closed=True))
+
+    def restyle(self, model):
+
+        if self.sketch_patches is None:
+            return True
+
+        drawn = self.sketch
+        sketch = self._sketch_lookup(model)
+        if sketch is drawn:
+            return True
+        if sketch is None or model.ui.debug:
+            # In debug mode, the bounding box needs redrawing.
+            return False
+
+        # The sketch width depends on the style so the leads need
+        # adjusting as well as the sketch.
+        p1, p1p, p2p, p2, tf = self._sketch_ends(model, sketch)
+
+        if not sketch.redraw(model, self.sketch_patches, tf,
+                             self.mirror, self.invert):
+            return False
+        self.sketch_tf = tf
+
+        lead1, lead2 = self.leads
+        lead1.set_data((p1.x, p1p.x), (p1.y, p1p.y))
+        lead2.set_data((p2p.x, p2.x), (p2p.y, p2.y))
+        return True
@@ -17,4 +17,4 @@ class Wire(Bipole):
         kwargs = self.make_kwargs(model, **kwargs)
 
         self.picture = Picture()
-        self.picture.add(sketcher.stroke_line(x1, y1, x2, y2, **kwargs))
+        self.picture.add(sketcher.stroke_segment(x1, y1, x2, y2, **kwargs))
@@ -0,0 +1,189 @@
+from numpy import (abs, full, hypot, inf, logical_and, nan, nonzero,
+                   where, zeros)
+
+
+# Kinds of hit path
+HIT_NONE = 0
+HIT_TRIANGLE = 3
+HIT_RECTANGLE = 4
+
+
+class CptTable:
+    """Table of the geometry used to hit-test components, stored as
+    arrays with a row for each component so that a test can be made
+    for many components with one call.  The arrays hold the node1 and
+    node2 positions, the coefficients of the inverse transform, the
+    hit path in component coordinates, and the extent.  The rows of
+    removed components are reused."""
+
+    def __init__(self, capacity=64):
+
+        self._allocate(capacity)
+        # Key to row
+        self.rows = {}
+        # Rows of removed keys that can be reused
+        self.free_rows = []
+        self.nrows = 0
+
+    def __len__(self):
+
+        return len(self.rows)
+
+    def __contains__(self, key):
+
+        return key in self.rows
+
+    def _allocate(self, capacity):
+
+        # Node1 x, y and node2 x, y
+        self.nodes = full((capacity, 4), nan)
+        # Coefficients a, b, c, d, e, f of the inverse transform
+        self.inverse = zeros((capacity, 6))
+        # Triangle vertices x0, y0, x1, y1, x2, y2, or the rectangle
+        # half width and half height in the first two columns
+        self.hit = zeros((capacity, 6))
+        self.hit_kind = zeros(capacity, dtype=int)
+        # xmin, ymin, xmax, ymax
+        self.extents = full((capacity, 4), nan)
+
+    def _grow(self):
+
+        nodes, inverse, hit = self.nodes, self.inverse, self.hit
+        hit_kind, extents = self.hit_kind, self.extents
+
+        self._allocate(2 * len(nodes))
+        n = len(nodes)
+        self.nodes[:n] = nodes
+        self.inverse[:n] = inverse
+        self.hit[:n] = hit
+        self.hit_kind[:n] = hit_kind
+        self.extents[:n] = extents
+
+    def clear(self):
+
+        self.rows = {}
+        self.free_rows = []
+        self.nrows = 0
+
+    def insert(self, key, gcpt):
+        """Add the geometry of the component `gcpt` for `key`, replacing
+        any existing entry for `key`."""
+
+        extent = gcpt.extent
+        if extent is None:
+            self.remove(key)
+            return
+
+        row = self.rows.get(key)
+        if row is None:
+            if self.free_rows:
+                row = self.free_rows.pop()
+            else:
+                if self.nrows == len(self.nodes):
+                    self._grow()
+                row = self.nrows
+                self.nrows += 1
+            self.rows[key] = row
+
+        self.extents[row] = extent
+
+        self.nodes[row] = nan
+        try:
+            pos1, pos2 = gcpt.node1.pos, gcpt.node2.pos
+        except IndexError:
+            # A component with a single node, such as a ground.
+            pos1 = pos2 = None
+        if pos1 is not None and pos2 is not None:
+            self.nodes[row] = pos1.x, pos1.y, pos2.x, pos2.y
+
+        self.hit_kind[row] = HIT_NONE
+        hit_path = ()
+        if getattr(gcpt, 'bbox_path', ()) != ():
+            hit_path = gcpt.hit_path
+        if len(hit_path) in (HIT_TRIANGLE, HIT_RECTANGLE):
+            self.inverse[row] = gcpt.inverse_tf_values
+            self.hit_kind[row] = len(hit_path)
+            if len(hit_path) == HIT_TRIANGLE:
+                self.hit[row] = [value for point in hit_path
+                                 for value in point]
+            else:
+                (x0, y0), (x1, y1), (x2, y2) = hit_path[0:3]
+                self.hit[row, 0:2] = abs(x1 - x0) / 2, abs(y2 - y0) / 2
+
+    def remove(self, key):
+
+        row = self.rows.pop(key, None)
+        if row is None:
+            return
+
+        self.nodes[row] = nan
+        self.extents[row] = nan
+        self.hit_kind[row] = HIT_NONE
+        self.free_rows.append(row)
+
+    def _rows(self, keys):
+
+        return [self.rows[key] for key in keys]
+
+    def contains_point(self, keys, x, y):
+        """Return array of bools, one for each key in `keys`, that are
+        True if (x, y) is within the hit path of the component.  This
+        is the same test as `Component.is_within_bbox`; a component
+        without a hit path is not hit."""
+
+        rows = self._rows(keys)
+        a, b, c, d, e, f = self.inverse[rows].T
+        xb = a * x + b * y + c
+        yb = d * x + e * y + f
+
+        hit = self.hit[rows]
+        kind = self.hit_kind[rows]
+
+        # For a rectangle centred on the origin
+        inside = logical_and(abs(xb) < hit[:, 0], abs(yb) < hit[:, 1])
+        result = (kind == HIT_RECTANGLE) & inside
+
+        x0, y0, x1, y1, x2, y2 = hit.T
+        s = (x0 - x2) * (yb - y2) - (y0 - y2) * (xb - x2)
+        t = (x1 - x0) * (yb - y0) - (y1 - y0) * (xb - x0)
+        d = (x2 - x1) * (yb - y1) - (y2 - y1) * (xb - x1)
+        outside = ((s < 0) != (t < 0)) & (s != 0) & (t != 0)
+        inside = ~outside & ((d == 0) | ((d < 0) == (s + t <= 0)))
+        result |= (kind == HIT_TRIANGLE) & inside
+
+        return result
+
+    def segment_distances(self, keys, x, y):
+        """Return array of the distances from (x, y) to the line segment
+        between node1 and node2 of the component for each key in
+        `keys`.  The distance is infinite if the nodes are at the same
+        position or are unknown.  This is the same as
+        `Component.distance_from_cpt` except that whether the nodes are
+        drawn is not considered."""
+
+        rows = self._rows(keys)
+        x1, y1, x2, y2 = self.nodes[rows].T
+
+        dx = x2 - x1
+        dy = y2 - y1
+        rsq = dx ** 2 + dy ** 2
+        valid = rsq > 0
+
+        # Closest point on the segment, clamped to the nodes
+        lerp = ((x - x1) * dx + (y - y1) * dy) / where(valid, rsq, 1)
+        lerp = lerp.clip(0, 1)
+
+        distances = hypot(lerp * dx + x1 - x, lerp * dy + y1 - y)
+        return where(valid, distances, inf)
+
+    def within(self, bbox):
+        """Return list of the keys with extents inside `bbox`, say for
+        a rubber-band selection."""
+
+        xmin, ymin, xmax, ymax = bbox
+        extents = self.extents[:self.nrows]
+
+        inside = ((extents[:, 0] >= xmin) & (extents[:, 1] >= ymin) &
+                  (extents[:, 2] <= xmax) & (extents[:, 3] <= ymax))
+        rows = set(nonzero(inside)[0].tolist())
+        return [key for key, row in self.rows.items() if row in rows]
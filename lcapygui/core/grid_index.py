@@ -0,0 +1,93 @@
+from math import floor
+
+
+class GridIndex:
+    """Spatial index of axis-aligned bounding boxes.  The plane is
+    divided into square cells and each key is stored in the cells its
+    bounding box overlaps, so a query only looks at the keys in the
+    cells that the query box overlaps.  Bounding boxes are tuples
+    (xmin, ymin, xmax, ymax)."""
+
+    def __init__(self, cell_size=4):
+
+        self.cell_size = cell_size
+        # Cell (i, j) to dict of keys, used as an ordered set
+        self.cells = {}
+        # Key to bounding box
+        self.bboxes = {}
+
+    def __len__(self):
+
+        return len(self.bboxes)
+
+    def __contains__(self, key):
+
+        return key in self.bboxes
+
+    def _cells(self, bbox):
+
+        xmin, ymin, xmax, ymax = bbox
+        size = self.cell_size
+
+        for i in range(floor(xmin / size), floor(xmax / size) + 1):
+            for j in range(floor(ymin / size), floor(ymax / size) + 1):
+                yield i, j
+
+    def bbox(self, key):
+
+        return self.bboxes.get(key)
+
+    def clear(self):
+
+        self.cells = {}
+        self.bboxes = {}
+
+    def insert(self, key, bbox):
+        """Add `key` with bounding box `bbox`, replacing any existing
+        entry for `key`."""
+
+        self.remove(key)
+
+        self.bboxes[key] = bbox
+        for cell in self._cells(bbox):
+            self.cells.setdefault(cell, {})[key] = True
+
+    def remove(self, key):
+
+        bbox = self.bboxes.pop(key, None)
+        if bbox is None:
+            return
+
+        for cell in self._cells(bbox):
+            keys = self.cells[cell]
+            del keys[key]
+            if keys == {}:
+                del self.cells[cell]
+
+    def query(self, bbox):
+        """Return list of the keys with bounding boxes that overlap
+        `bbox`."""
+
+        xmin, ymin, xmax, ymax = bbox
+        size = self.cell_size
+
+        imin, imax = floor(xmin / size), floor(xmax / size)
+        jmin, jmax = floor(ymin / size), floor(ymax / size)
+        if (imax - imin + 1) * (jmax - jmin + 1) > len(self.cells):
+            # For a large query box, it is quicker to look at the
+            # occupied cells.
+            cells = [(i, j) for i, j in self.cells
+                     if imin <= i <= imax and jmin <= j <= jmax]
+        else:
+            cells = self._cells(bbox)
+
+        found = {}
+        for cell in cells:
+            for key in self.cells.get(cell, ()):
+                if key in found:
+                    continue
+                xmin1, ymin1, xmax1, ymax1 = self.bboxes[key]
+                if (xmin1 <= xmax and xmax1 >= xmin and
+                        ymin1 <= ymax and ymax1 >= ymin):
+                    found[key] = True
+        return list(found)
@@ -11,6 +11,18 @@ class Picture:
 
         self.elts.append(patch)
 
+    def __iter__(self):
+        """Iterate over the artists."""
+
+        def artists(elt):
+            if isinstance(elt, list):
+                for elt1 in elt:
+                    yield from artists(elt1)
+            else:
+                yield elt
+
+        return artists(self.elts)
+
     def remove(self):
 
         def erase(elt):
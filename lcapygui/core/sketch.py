@@ -1,29 +1,61 @@
 from lcapy import Circuit
+from lcapy.cache import cached_property
 from .tf import TF
 from .svgparse import SVGParse
+from .sketch_bundle import SketchBundle
 from os.path import join
 from matplotlib.path import Path
+from numpy import arange, array, concatenate, full, zeros
 from warnings import warn
 
+# Maximum number of oriented paths cached for each sketch
+ORIENTED_PATHS_CACHE_SIZE = 64
+
 
 class SketchPath:
+    """A path of a sketch.  For a symbol, such as a text glyph, `path`
+    is the glyph path shared by all the uses of the symbol and `offset`
+    is the translation for this use.  The translated path is only made
+    when it is needed."""
 
-    def __init__(self, path, style, symbol):
+    def __init__(self, path, style, symbol, fill=None, offset=(0, 0)):
 
-        self.path = path
+        self.base_path = path
+        self.offset = offset
         self.style = style
         self.symbol = symbol
+        if fill is None:
+            fill = symbol or ('fill' in style and style['fill'] != 'none')
+        self.fill = fill
 
     @property
-    def fill(self):
+    def path(self):
 
-        return self.symbol or ('fill' in self.style and self.style['fill'] != 'none')
+        dx, dy = self.offset
+        if dx == 0 and dy == 0:
+            return self.base_path
+        return Path(self.base_path.vertices + self.offset,
+                    self.base_path.codes)
 
     def transform(self, transform):
 
         path = self.path.transformed(transform)
 
-        return self.__class__(path, self.style, self.symbol)
+        return self.__class__(path, self.style, self.symbol, self.fill)
+
+    def translate(self, dx, dy):
+        """This is a cheaper version of transform for a translation.
+        For a symbol, the glyph path is shared and only the offset is
+        changed."""
+
+        if self.symbol:
+            xoffset, yoffset = self.offset
+            return self.__class__(self.base_path, self.style, self.symbol,
+                                  self.fill, (xoffset + dx, yoffset + dy))
+
+        path = Path(self.path.vertices + (dx, dy), self.path.codes)
+
+        return self.__class__(path, self.style, self.symbol, self.fill)
 
 
 class Sketch:
@@ -39,6 +71,12 @@ class Sketch:
         self.width = width
         self.height = height
         self.kwargs = kwargs
+        # Offsets indexed by sketch key
+        self._offsets = {}
+        # Wire start vertices indexed by search arguments
+        self._wire_starts_cache = {}
+        # Oriented paths indexed by orientation arguments
+        self._oriented_paths_cache = {}
 
     @property
     def width_pt(self):
@@ -65,6 +103,23 @@ class Sketch:
 
         return self.kwargs.get('color', 'black')
 
+    @cached_property
+    def compound_paths(self):
+        """List of (path, fill) tuples where the stroked paths are
+        merged into one compound path and the filled paths are merged
+        into another.  This allows a sketch to be drawn with at most
+        two patches."""
+
+        stroked = [spath.path for spath in self.paths if not spath.fill]
+        filled = [spath.path for spath in self.paths if spath.fill]
+
+        paths = []
+        if stroked != []:
+            paths.append((Path.make_compound_path(*stroked), False))
+        if filled != []:
+            paths.append((Path.make_compound_path(*filled), True))
+        return paths
+
     @classmethod
     def create(cls, sketch_key, sketch_net, style='american'):
         """This creates and stores a sketch file."""
@@ -87,7 +142,26 @@ class Sketch:
 
     @classmethod
     def load(cls, sketch_key, style='american', complain=True):
-        """This loads a sketch file give a sketch_key."""
+        """This loads a sketch give a sketch_key.  The precompiled
+        sketch bundle is used if it is up to date, otherwise the SVG
+        file is parsed."""
+
+        from lcapygui import __datadir__
+
+        svg_filename = __datadir__ / 'svg' / style / (sketch_key + '.svg')
+
+        if svg_filename.exists():
+            bundle = SketchBundle.load(style)
+            if bundle is not None:
+                sketch = bundle.lookup(sketch_key, svg_filename)
+                if sketch is not None:
+                    return sketch
+
+        return cls.load_svg(sketch_key, style, complain)
+
+    @classmethod
+    def load_svg(cls, sketch_key, style='american', complain=True):
+        """This loads a sketch SVG file give a sketch_key."""
 
         from lcapygui import __datadir__
 
@@ -115,66 +189,115 @@ class Sketch:
         return sketch
 
     @classmethod
-    def load_file(cls, svg_filename):
+    def load_file(cls, svg_filename, backend='expat'):
         """This loads a sketch file given a filename."""
 
-        svg = SVGParse(svg_filename)
+        svg = SVGParse(svg_filename, backend=backend)
+
+        return cls.from_svg(svg)
+
+    @classmethod
+    def from_svg(cls, svg):
+        """This creates a sketch from a parsed SVG file."""
 
         sketch_paths = []
         for svga_path in svg.paths:
             sketch_path = SketchPath(
                 svga_path.path, svga_path.style, svga_path.symbol)
-            sketch_path = sketch_path.transform(TF(svga_path.transform))
+            transform = svga_path.transform
+            if svga_path.symbol:
+                # Symbol uses are translated glyphs
+                sketch_path = sketch_path.translate(*transform[0:2, 2])
+            else:
+                sketch_path = sketch_path.transform(TF(transform))
             sketch_paths.append(sketch_path)
 
         sketch = cls(sketch_paths, svg.width, svg.height)
         return sketch
 
+    @cached_property
+    def stacked(self):
+        """Tuple of the vertices and codes of all the paths stacked into
+        single arrays, and the start index and length of each path."""
+
+        vertices = []
+        codes = []
+        for spath in self.paths:
+            path = spath.path
+            path_codes = path.codes
+            if path_codes is None:
+                path_codes = full(len(path.vertices), Path.LINETO,
+                                  dtype=Path.code_type)
+                path_codes[0:1] = Path.MOVETO
+            vertices.append(path.vertices)
+            codes.append(path_codes)
+
+        lengths = array([len(path_codes) for path_codes in codes], dtype=int)
+        starts = lengths.cumsum() - lengths
+
+        if vertices == []:
+            return zeros((0, 2)), zeros(0, dtype=Path.code_type), \
+                starts, lengths
+
+        return concatenate(vertices), concatenate(codes), starts, lengths
+
+    def _wire_starts(self, codes, exact, axis):
+        """Return array of the first vertices of the paths starting with
+        `codes` (or consisting only of `codes` if `exact` is True) where
+        the first segment is vertical (`axis` 0) or horizontal (`axis`
+        1).  The result is cached."""
+
+        key = (codes, exact, axis)
+        if key in self._wire_starts_cache:
+            return self._wire_starts_cache[key]
+
+        vertices, path_codes, starts, lengths = self.stacked
+
+        n = len(codes)
+        if exact:
+            starts = starts[lengths == n]
+        else:
+            starts = starts[lengths >= n]
+
+        index = starts[:, None] + arange(n)
+        starts = starts[(path_codes[index] == codes).all(axis=1)]
+
+        v0 = vertices[starts]
+        v1 = vertices[starts + 1]
+        candidates = v0[v0[:, axis] == v1[:, axis]]
+
+        self._wire_starts_cache[key] = candidates
+        return candidates
+
     def horizontal_wire_pair_offsets(self):
 
-        candidates = []
-        for path in self.paths:
-            if len(path.path) >= 4 and all(path.path.codes[0:4] == (1, 2, 1, 2)):
-                vertices = path.path.vertices
-                if vertices[0][1] == vertices[1][1]:
-                    xoffset = vertices[0][0]
-                    yoffset = vertices[0][1]
-                    candidates.append((xoffset, yoffset))
-
-        if candidates == []:
+        candidates = self._wire_starts((1, 2, 1, 2), False, 1)
+
+        if len(candidates) == 0:
             return None, None
 
         # Search for horizontal line with longest extent.
-        xmin = 1000
-        yoffset = 0
-        for candidate in candidates:
-            if candidate[0] < xmin:
-                xmin = candidate[0]
-                yoffset = candidate[1]
+        m = candidates[:, 0].argmin()
+        if candidates[m, 0] < 1000:
+            yoffset = candidates[m, 1]
+        else:
+            yoffset = 0
 
         return self.width / 2, yoffset
 
     def vertical_wire_pair_offsets(self):
 
-        candidates = []
-        for path in self.paths:
-            if len(path.path) >= 4 and all(path.path.codes[0:4] == (1, 2, 1, 2)):
-                vertices = path.path.vertices
-                if vertices[0][0] == vertices[1][0]:
-                    xoffset = vertices[0][0]
-                    yoffset = vertices[0][1]
-                    candidates.append((xoffset, yoffset))
-
-        if candidates == []:
+        candidates = self._wire_starts((1, 2, 1, 2), False, 0)
+
+        if len(candidates) == 0:
             return None, None
 
-        # Search for horizontal line with longest extent.
-        ymin = 1000
-        yoffset = 0
-        for candidate in candidates:
-            if candidate[1] < ymin:
-                ymin = candidate[1]
-                xoffset = candidate[0]
+        # Search for vertical line with longest extent.
+        m = candidates[:, 1].argmin()
+        if candidates[m, 1] < 1000:
+            xoffset = candidates[m, 0]
+        else:
+            xoffset = candidates[-1, 0]
 
         return xoffset, self.height / 2
 
@@ -183,28 +306,24 @@ class Sketch:
         # Look for vertical wire (for ground, sground, cground,
         # rground) Note, if look for horizontal wire first, get
         # incorrect offset for rground
-        for path in self.paths:
-            if len(path.path) == 2 and all(path.path.codes == (1, 2)):
-                vertices = path.path.vertices
-                if vertices[0][0] == vertices[1][0]:
-                    xoffset = vertices[0][0]
-                    yoffset = vertices[0][1]
-                    return xoffset, yoffset
+        candidates = self._wire_starts((1, 2), True, 0)
 
-        return None, None
+        if len(candidates) == 0:
+            return None, None
+
+        xoffset, yoffset = candidates[0]
+        return xoffset, yoffset
 
     def horizontal_wire_offsets(self):
 
         # Look for single horizontal wire (this is triggered by W components)
-        for path in self.paths:
-            if len(path.path) == 2 and all(path.path.codes == (1, 2)):
-                vertices = path.path.vertices
-                if vertices[0][1] == vertices[1][1]:
-                    xoffset = vertices[0][0]
-                    yoffset = vertices[0][1]
-                    return self.width / 2, yoffset
+        candidates = self._wire_starts((1, 2), True, 1)
+
+        if len(candidates) == 0:
+            return None, None
 
-        return None, None
+        yoffset = candidates[0, 1]
+        return self.width / 2, yoffset
 
     def parse_sketch_key(self, sketch_key):
 
@@ -224,6 +343,12 @@ class Sketch:
         """Find the offsets required to centre the sketch.
         Currently transistors are not centered horizontally."""
 
+        if sketch_key not in self._offsets:
+            self._offsets[sketch_key] = self._find_offsets(sketch_key)
+        return self._offsets[sketch_key]
+
+    def _find_offsets(self, sketch_key):
+
         cpt_type, cpt_kind, cpt_style = self.parse_sketch_key(sketch_key)
 
         if cpt_type in ('fdopamp', ):
@@ -280,42 +405,124 @@ class Sketch:
 
         paths = []
         for path in self.paths:
-            paths.append(path.transform(TF().translate(-xoffset, -yoffset)))
+            paths.append(path.translate(-xoffset, -yoffset))
 
         return self.__class__(paths, self.width, self.height, **self.kwargs)
 
+    def _draw_params(self, tf):
+        """Return the offset, angle, and scale for drawing the sketch
+        with the component transform `tf`.  The angle and scale are
+        rounded so that components with the same orientation share the
+        same oriented paths."""
+
+        offset = tuple(tf.transform((0, 0)))
+        angle = round(float(tf.angle_deg), 6) % 360
+        scale = round(float(tf.scale_factor) *
+                      self.PT_TO_CM / self.NODE_SPACING, 12)
+        return offset, angle, scale
+
+    def oriented_paths(self, angle, scale, mirror=False, invert=False,
+                       compound=True):
+        """Return list of (path, fill) tuples for the sketch rotated by
+        `angle` degrees and scaled by `scale` but not translated.  If
+        `compound` is True, the compound paths are used.  The result is
+        cached since most components share a few orientations; the paths
+        must not be modified."""
+
+        key = (angle, scale, mirror, invert, compound)
+        paths = self._oriented_paths_cache.get(key)
+        if paths is None:
+            paths = self._oriented_paths(*key)
+            if len(self._oriented_paths_cache) >= ORIENTED_PATHS_CACHE_SIZE:
+                # Discard the oldest entry.
+                cache = self._oriented_paths_cache
+                del cache[next(iter(cache))]
+            self._oriented_paths_cache[key] = paths
+        return paths
+
+    def _oriented_paths(self, angle, scale, mirror, invert, compound):
+
+        if compound:
+            spaths = self.compound_paths
+        else:
+            spaths = [(spath.path, spath.fill) for spath in self.paths]
+
+        tf = TF().rotate_deg(-angle).scale(scale)
+
+        paths = []
+        for path, fill in spaths:
+            vertices = path.vertices
+
+            # Note, the SVG coordinate system has y going down the screen
+            # but Matplotlib's coordinate system has y going up the screen.
+            # Thus we need to invert the sense of mirror.
+
+            if not mirror:
+                vertices = vertices * (1, -1)
+            if invert:
+                vertices = vertices * (-1, 1)
+
+            path = Path(tf.transform(vertices), path.codes, readonly=True)
+            paths.append((path, fill))
+
+        return paths
+
     def draw(self, model, tf, **kwargs):
 
         sketcher = model.ui.sketcher
 
-        # TODO, simplify  (tf.scale() but don't want to scale the offset)
+        offset, angle, scale = self._draw_params(tf)
+        return sketcher.place_sketch(self, offset, angle, scale, **kwargs)
+
+    def redraw(self, model, patches, tf, mirror=False, invert=False):
+        """Replace the paths of patches drawn for another sketch with
+        the paths of this sketch.  This returns False if the patches
+        cannot be reused."""
+
+        sketcher = model.ui.sketcher
 
-        c = tf.transform((0, 0))
+        offset, angle, scale = self._draw_params(tf)
+        return sketcher.resketch(patches, self, offset, angle, scale,
+                                 mirror, invert)
 
-        tf = TF().rotate_deg(-tf.angle_deg).scale(tf.scale_factor *
-                                                  self.PT_TO_CM / self.NODE_SPACING)
-        tf = tf.translate(*c)
+    def move(self, model, patches, tf):
+        """Move patches drawn for this sketch to the position of the
+        transform `tf`.  The orientation is assumed unchanged."""
 
-        return sketcher.sketch(self, tf, **kwargs)
+        sketcher = model.ui.sketcher
+
+        offset, angle, scale = self._draw_params(tf)
+        sketcher.move_patches(patches, offset)
+
+    @property
+    def nbytes(self):
+        """Memory used by the path vertices and codes.  The glyph paths
+        shared by symbols are only counted once."""
+
+        paths = {id(spath.base_path): spath.base_path
+                 for spath in self.paths}
+
+        nbytes = 0
+        for path in paths.values():
+            nbytes += path.vertices.nbytes
+            if path.codes is not None:
+                nbytes += path.codes.nbytes
+        return nbytes
+
+    @cached_property
+    def bounds(self):
+        """Tuple of the minimum and maximum x and y coordinates of the
+        path end points (xmin, xmax, ymin, ymax)."""
+
+        vertices, codes, starts, lengths = self.stacked
+
+        vertices = vertices[(codes == Path.MOVETO) | (codes == Path.LINETO)]
+        x = vertices[:, 0]
+        y = vertices[:, 1]
+
+        return (x.min(initial=1000), x.max(initial=-1000),
+                y.min(initial=1000), y.max(initial=-1000))
 
     def minmax(self):
 
-        xmin = 1000
-        ymin = 1000
-        xmax = -1000
-        ymax = -1000
-        for spath in self.paths:
-            path = spath.path
-            for v, c in zip(path.vertices, path.codes):
-                if c in (Path.MOVETO, Path.LINETO):
-                    pos = v
-                    if pos[0] > xmax:
-                        xmax = pos[0]
-                    if pos[0] < xmin:
-                        xmin = pos[0]
-                    if pos[1] > ymax:
-                        ymax = pos[1]
-                    if pos[1] < ymin:
-                        ymin = pos[1]
-
-        return xmin, xmax, ymin, ymax
+        return self.bounds
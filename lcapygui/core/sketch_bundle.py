@@ -0,0 +1,237 @@
+"""
+This compiles the SVG sketches for a drawing style into a single
+binary bundle so that the sketches can be loaded without parsing the
+SVG files at run time.
+
+The bundle file has the following layout:
+
+1. An 8 byte magic string
+2. The header length (little endian uint32)
+3. A JSON header padded to a multiple of 16 bytes
+4. The vertices for all the paths (float64, N x 2)
+5. The codes for all the paths (uint8, N)
+
+The header records, for each sketch key, the size, modification time,
+and a hash of the SVG file contents, the sketch width and height, and
+the vertex range, fill and symbol flags for each path.  The vertices
+are stored after alignment.
+
+An entry is up to date if the size and modification time of the SVG
+file are unchanged.  Otherwise, for example, after the files have been
+checked out or installed, the SVG file is hashed.
+"""
+
+from hashlib import sha1
+from json import dumps, loads
+from os import stat
+from threading import Lock
+from warnings import warn
+import numpy as np
+
+from matplotlib.path import Path
+
+
+class SketchBundle:
+
+    MAGIC = b'LCSKETCH'
+    # Increment this if the sketch alignment or the file format changes
+    VERSION = 2
+    FILENAME = 'sketches.bundle'
+
+    # Loaded bundles indexed by filename.  The sketches are loaded by
+    # worker threads so this is guarded by _lock.
+    _bundles = {}
+    _lock = Lock()
+
+    def __init__(self, filename, header, vertices, codes):
+
+        self.filename = filename
+        self.header = header
+        self.vertices = vertices
+        self.codes = codes
+        # Sketch key to the (size, mtime) of the SVG file last found
+        # to match the hash
+        self.verified = {}
+
+    @classmethod
+    def dirname(cls, style):
+
+        from lcapygui import __datadir__
+
+        return __datadir__ / 'svg' / style
+
+    @classmethod
+    def svg_hash(cls, svg_filename):
+
+        with open(svg_filename, 'rb') as f:
+            return sha1(f.read()).hexdigest()
+
+    @classmethod
+    def svg_stat(cls, svg_filename):
+
+        st = stat(svg_filename)
+        return st.st_size, st.st_mtime_ns
+
+    @classmethod
+    def build(cls, style='american', dirname=None):
+        """Compile all the SVG files for the specified style into a
+        bundle.  This returns the bundle filename."""
+
+        from .sketch import Sketch
+
+        if dirname is None:
+            dirname = cls.dirname(style)
+
+        sketches = {}
+        vertices = []
+        codes = []
+        nvertices = 0
+
+        for svg_filename in sorted(dirname.glob('*.svg')):
+            sketch_key = svg_filename.stem
+
+            sketch = Sketch.load_svg(sketch_key, style, complain=False)
+            if sketch is None:
+                continue
+
+            paths = []
+            for spath in sketch.paths:
+                path = spath.path
+                n = len(path.vertices)
+                if path.codes is None:
+                    path_codes = np.full(n, Path.LINETO, dtype=np.uint8)
+                    path_codes[0] = Path.MOVETO
+                else:
+                    path_codes = path.codes
+
+                vertices.append(path.vertices)
+                codes.append(path_codes)
+                paths.append((nvertices, nvertices + n,
+                              bool(spath.fill), bool(spath.symbol)))
+                nvertices += n
+
+            size, mtime = cls.svg_stat(svg_filename)
+            sketches[sketch_key] = {'hash': cls.svg_hash(svg_filename),
+                                    'size': size,
+                                    'mtime': mtime,
+                                    'width': float(sketch.width),
+                                    'height': float(sketch.height),
+                                    'paths': paths}
+
+        header = {'version': cls.VERSION,
+                  'style': style,
+                  'nvertices': nvertices,
+                  'sketches': sketches}
+
+        if vertices == []:
+            vertices = np.zeros((0, 2))
+            codes = np.zeros(0, dtype=np.uint8)
+        else:
+            vertices = np.concatenate(vertices).astype('<f8')
+            codes = np.concatenate(codes).astype(np.uint8)
+
+        header_bytes = dumps(header, separators=(',', ':')).encode('utf-8')
+        header_bytes += b' ' * (-(len(cls.MAGIC) + 4 + len(header_bytes)) % 16)
+
+        filename = dirname / cls.FILENAME
+        with open(filename, 'wb') as f:
+            f.write(cls.MAGIC)
+            f.write(np.uint32(len(header_bytes)).astype('<u4').tobytes())
+            f.write(header_bytes)
+            f.write(vertices.tobytes())
+            f.write(codes.tobytes())
+
+        # Force reload.
+        with cls._lock:
+            cls._bundles.pop(str(filename), None)
+
+        return filename
+
+    @classmethod
+    def load(cls, style='american', dirname=None):
+        """Memory-map the bundle for the specified style.  This
+        returns None if the bundle does not exist or is unusable."""
+
+        if dirname is None:
+            dirname = cls.dirname(style)
+        filename = dirname / cls.FILENAME
+
+        key = str(filename)
+        with cls._lock:
+            if key in cls._bundles:
+                return cls._bundles[key]
+
+            bundle = None
+            try:
+                bundle = cls._load(filename)
+            except FileNotFoundError:
+                pass
+            except (ValueError, OSError) as e:
+                warn('Ignoring sketch bundle %s: %s' % (filename, e))
+
+            cls._bundles[key] = bundle
+        return bundle
+
+    @classmethod
+    def _load(cls, filename):
+
+        with open(filename, 'rb') as f:
+            magic = f.read(len(cls.MAGIC))
+            if magic != cls.MAGIC:
+                raise ValueError('bad magic')
+            header_len = int(np.frombuffer(f.read(4), dtype='<u4')[0])
+            header = loads(f.read(header_len).decode('utf-8'))
+
+        if header['version'] != cls.VERSION:
+            raise ValueError('version %s, expected %s' %
+                             (header['version'], cls.VERSION))
+
+        n = header['nvertices']
+        if n == 0:
+            return cls(filename, header, np.zeros((0, 2)),
+                       np.zeros(0, dtype=np.uint8))
+
+        offset = len(cls.MAGIC) + 4 + header_len
+        vertices = np.memmap(filename, dtype='<f8', mode='r',
+                             offset=offset, shape=(n, 2))
+        codes = np.memmap(filename, dtype=np.uint8, mode='r',
+                          offset=offset + vertices.nbytes, shape=(n, ))
+        return cls(filename, header, vertices, codes)
+
+    def lookup(self, sketch_key, svg_filename):
+        """Return the Sketch for `sketch_key` or None if it is not
+        in the bundle or if the bundle entry is stale with respect to
+        `svg_filename`."""
+
+        from .sketch import Sketch, SketchPath
+
+        entry = self.header['sketches'].get(sketch_key)
+        if entry is None:
+            return None
+
+        if not self.is_current(sketch_key, entry, svg_filename):
+            return None
+
+        paths = []
+        for start, end, fill, symbol in entry['paths']:
+            path = Path(self.vertices[start:end], self.codes[start:end])
+            paths.append(SketchPath(path, {}, symbol, fill=fill))
+
+        return Sketch(paths, entry['width'], entry['height'])
+
+    def is_current(self, sketch_key, entry, svg_filename):
+        """Return True if the bundle entry for `sketch_key` matches
+        `svg_filename`.  The file is only hashed if its size or
+        modification time differs from when it was last checked."""
+
+        svg_stat = self.svg_stat(svg_filename)
+        if svg_stat == (entry['size'], entry['mtime']):
+            return True
+        if svg_stat == self.verified.get(sketch_key):
+            return True
+
+        if entry['hash'] != self.svg_hash(svg_filename):
+            return False
+
+        self.verified[sketch_key] = svg_stat
+        return True
@@ -1,7 +1,8 @@
 from xml.dom import minidom
+from xml.parsers import expat
 from svgpathtools.parser import parse_transform
 from svgpath2mpl import parse_path
-from numpy import all
+from numpy import all, array
 
 # TODO: look for style attribute, split by semicolon.  One of the most
 # useful is fill, for example, 'fill:rgb(0%,0%,0%)' or 'fill:none'.
@@ -39,20 +40,29 @@ class SVGPath:
 
 
 class SVGParse:
+    """Parse an SVG file created by Circuitikz.  There are two backends:
+    `minidom` builds a DOM and `expat` parses the file in a single
+    streaming pass.  Both produce the same list of SVGPath objects."""
 
-    def __init__(self, filename):
+    backends = ('minidom', 'expat')
+
+    def __init__(self, filename, backend='minidom'):
 
         self.filename = filename
+        self.paths = []
+        # Parsed symbol paths indexed by symbol_id
+        self.glyphs = {}
 
-        doc = minidom.parse(filename)
+        if backend == 'minidom':
+            self._parse_minidom(filename)
+        elif backend == 'expat':
+            self._parse_expat(filename)
+        else:
+            raise ValueError('Unsupported backend %s, must be either %s'
+                             % (backend, ', '.join(self.backends)))
 
-        svg_paths = doc.getElementsByTagName('path')
-        svg_defs = doc.getElementsByTagName('defs')
-        svg_uses = doc.getElementsByTagName('use')
+    def _set_size(self, width_str, height_str):
 
-        svg = doc.getElementsByTagName('svg')[0]
-        width_str = svg.getAttribute('width')
-        height_str = svg.getAttribute('height')
         if not width_str.endswith('pt'):
             raise ValueError('Need to to handle other units.')
         if not height_str.endswith('pt'):
@@ -61,27 +71,58 @@ class SVGParse:
         self.width = float(width_str[:-2])
         self.height = float(height_str[:-2])
 
+    def _add_path(self, d, transform, style):
+
+        if transform == '':
+            transform = 'matrix(1,0,0,1,0,0)'
+
+        path = parse_path(d)
+        transform = parse_transform(transform)
+        self.paths.append(
+            SVGPath(path, transform, parse_style(style), False))
+
+    def _add_uses(self, uses, symbols, style):
+        """Add the symbol uses.  `uses` is a list of (symbol_id, x, y)
+        tuples and `symbols` maps a symbol_id to its path data.  Note,
+        the uses inherit the style of the last drawing path.
+
+        Each symbol is parsed once into the glyph table; all the uses
+        of a symbol share the glyph path and differ only by their
+        translation."""
+
+        style = parse_style(style)
+
+        for symbol_id, x, y in uses:
+            glyph = self.glyphs.get(symbol_id)
+            if glyph is None:
+                glyph = parse_path(symbols[symbol_id])
+                self.glyphs[symbol_id] = glyph
+
+            transform = array(((1, 0, float(x)),
+                               (0, 1, float(y)),
+                               (0, 0, 1)))
+            self.paths.append(SVGPath(glyph, transform, style, True))
+
+    def _parse_minidom(self, filename):
+
+        doc = minidom.parse(filename)
+
+        svg_paths = doc.getElementsByTagName('path')
+        svg_defs = doc.getElementsByTagName('defs')
+        svg_uses = doc.getElementsByTagName('use')
+
+        svg = doc.getElementsByTagName('svg')[0]
+        self._set_size(svg.getAttribute('width'), svg.getAttribute('height'))
+
         # Ignore paths for symbol defs and clip paths
         svg_paths = [path for path in svg_paths
                      if path.parentNode.tagName not in ('symbol', 'clipPath')]
 
-        svg_ds = [path.getAttribute('d') for path in svg_paths]
-        svg_styles = [path.getAttribute('style') for path in svg_paths]
-        svg_transforms = [path.getAttribute('transform') for path in svg_paths]
-
-        transforms = []
-        for transform in svg_transforms:
-            if transform == '':
-                transform = 'matrix(1,0,0,1,0,0)'
-            transforms.append(transform)
-        svg_transforms = transforms
-
-        self.paths = []
-        for d, transform, style in zip(svg_ds, svg_transforms, svg_styles):
-            path = parse_path(d)
-            transform = parse_transform(transform)
-            self.paths.append(
-                SVGPath(path, transform, parse_style(style), False))
+        style = ''
+        for path in svg_paths:
+            style = path.getAttribute('style')
+            self._add_path(path.getAttribute('d'),
+                           path.getAttribute('transform'), style)
 
         if svg_defs != []:
             svg_symbols = svg_defs[0].getElementsByTagName('symbol')
@@ -92,12 +133,73 @@ class SVGParse:
                 d = path.getAttribute('d')
                 symbols[symbol_id] = d
 
+            uses = []
             for use in svg_uses:
                 symbol_id = use.getAttribute('xlink:href')[1:]
-                x = use.getAttribute('x')
-                y = use.getAttribute('y')
-                transform = 'matrix(1,0,0,1,%s,%s)' % (x, y)
-                path = parse_path(symbols[symbol_id])
-                transform = parse_transform(transform)
-                self.paths.append(
-                    SVGPath(path, transform, parse_style(style), True))
+                uses.append((symbol_id, use.getAttribute('x'),
+                             use.getAttribute('y')))
+
+            self._add_uses(uses, symbols, style)
+
+    def _parse_expat(self, filename):
+
+        # Element names of the ancestors of the current element
+        stack = []
+        # Path attributes for the drawing paths
+        svg_paths = []
+        uses = []
+        symbols = {}
+        state = {'svg': False, 'defs': 0, 'in_defs': False,
+                 'symbol': None, 'symbol_path': False}
+
+        def start_element(name, attrs):
+
+            parent = stack[-1] if stack else None
+            stack.append(name)
+
+            if name == 'path':
+                symbol_id = state['symbol']
+                if symbol_id is not None and not state['symbol_path']:
+                    # First path of a symbol in the first defs
+                    symbols[symbol_id] = attrs.get('d', '')
+                    state['symbol_path'] = True
+                if parent not in ('symbol', 'clipPath'):
+                    svg_paths.append(attrs)
+            elif name == 'use':
+                uses.append((attrs.get('xlink:href', '')[1:],
+                             attrs.get('x', ''), attrs.get('y', '')))
+            elif name == 'symbol':
+                if state['in_defs'] and state['defs'] == 1:
+                    state['symbol'] = attrs.get('id', '')
+                    state['symbol_path'] = False
+            elif name == 'defs':
+                state['defs'] += 1
+                state['in_defs'] = True
+            elif name == 'svg' and not state['svg']:
+                state['svg'] = True
+                self._set_size(attrs.get('width', ''),
+                               attrs.get('height', ''))
+
+        def end_element(name):
+
+            stack.pop()
+            if name == 'symbol':
+                state['symbol'] = None
+            elif name == 'defs':
+                state['in_defs'] = False
+
+        parser = expat.ParserCreate()
+        parser.StartElementHandler = start_element
+        parser.EndElementHandler = end_element
+
+        with open(filename, 'rb') as f:
+            parser.ParseFile(f)
+
+        style = ''
+        for attrs in svg_paths:
+            style = attrs.get('style', '')
+            self._add_path(attrs.get('d', ''), attrs.get('transform', ''),
+                           style)
+
+        if state['defs'] > 0:
+            self._add_uses(uses, symbols, style)
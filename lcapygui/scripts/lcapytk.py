@@ -78,6 +78,9 @@ def main(argv=None):
                         help='sophistication level')
     parser.add_argument('--expr', type=str, default=None,
                         help='Lcapy expression')
+    parser.add_argument('--no-warmup', action='store_true',
+                        default=False,
+                        help='do not load the component sketches at startup')
     parser.add_argument('--create-shortcut', action='store_true',
                         help='Create a system shortcut', default=False)
     parser.add_argument('filenames', type=str, nargs='*',
@@ -102,7 +105,8 @@ def main(argv=None):
         sys.excepthook = schtex_exception
 
     e = LcapyTk(args.filenames, debug=args.debug,
-                level=args.level, devel=args.devel, icon=icon_filename)
+                level=args.level, devel=args.devel, icon=icon_filename,
+                warmup=not args.no_warmup)
 
     if args.expr is not None:
         dialog = e.show_expr_dialog(lcapify(args.expr))
@@ -3,11 +3,17 @@
 Copyright (c) 2023 Michael P. Hayes, UC ECE, NZ
 
 Usage: sketchview infile.svg
+       sketchview --bench [--style STYLE] [--backend BACKEND] [--json FILENAME]
+                  [sketch_key...]
 """
 
 from argparse import ArgumentParser
+from json import dump
+from time import perf_counter
 import sys
 from lcapygui.core.sketch import Sketch
+from lcapygui.core.sketch_bundle import SketchBundle
+from lcapygui.core.svgparse import SVGParse
 from lcapygui.core.tf import TF
 from lcapygui.core.cpt_maker import gcpt_make_from_sketch_key
 from lcapygui.ui.tk.sketcher import Sketcher
@@ -68,6 +74,100 @@ def sketchview(sketch_key, pins, points):
             sketcher.text(x, y, pinname)
 
 
+def sketchbench(sketch_keys=None, styles=None, repeat=3, top=10,
+                json_filename=None, backend='expat'):
+    """Time each stage of loading and drawing the sketches: parsing
+    the SVG file with the SVGParse `backend`, building the paths,
+    aligning the sketch, looking up the sketch in the precompiled
+    bundle, and rendering the sketch with the Agg backend.  The
+    minimum time of `repeat` runs is used for each stage.  The
+    default backend is the one used by `Sketch.load_file`."""
+
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from lcapygui.sketch_library import SketchLibrary
+
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(1, 1, 1)
+    sketcher = Sketcher(ax)
+
+    # Convert from points to circuitikz units
+    tf = TF().scale(2.54 / 72 / 2)
+
+    if styles is None:
+        styles = SketchLibrary.styles
+
+    stages = ('parse', 'build', 'align', 'bundle', 'render')
+
+    results = {}
+    for style in styles:
+        dirname = SketchBundle.dirname(style)
+
+        keys = sketch_keys
+        if keys is None or keys == []:
+            keys = SketchLibrary().sketch_keys(style)
+
+        for sketch_key in keys:
+            svg_filename = dirname / (sketch_key + '.svg')
+            if not svg_filename.exists():
+                print('Skipping %s for %s: no SVG file' % (sketch_key, style))
+                continue
+
+            times = dict.fromkeys(stages, float('inf'))
+            for m in range(repeat):
+                t0 = perf_counter()
+                svg = SVGParse(str(svg_filename), backend=backend)
+                t1 = perf_counter()
+                sketch = Sketch.from_svg(svg)
+                t2 = perf_counter()
+                sketch = sketch.align(sketch_key)
+                t3 = perf_counter()
+                bundle = SketchBundle.load(style)
+                if bundle is not None:
+                    bundle.lookup(sketch_key, svg_filename)
+                t4 = perf_counter()
+                ax.clear()
+                # As for the previewer; the axes are not of interest.
+                ax.axis('off')
+                sketcher.sketch(sketch, tf, color='blue')
+                fig.canvas.draw()
+                t5 = perf_counter()
+
+                for stage, dt in zip(stages, (t1 - t0, t2 - t1, t3 - t2,
+                                              t4 - t3, t5 - t4)):
+                    times[stage] = min(times[stage], dt)
+
+            results[style + '/' + sketch_key] = times
+
+    totals = {stage: sum(times[stage] for times in results.values())
+              for stage in stages}
+
+    print('%d sketches, %d runs each, %s parser' % (len(results), repeat,
+                                                    backend))
+    print('Stage totals:')
+    for stage in stages:
+        print('  %-7s %8.1f ms' % (stage, totals[stage] * 1e3))
+    print('  %-7s %8.1f ms' % ('total', sum(totals.values()) * 1e3))
+
+    slowest = sorted(results.items(), key=lambda item: -sum(item[1].values()))
+    print('Slowest sketches:')
+    for key, times in slowest[:top]:
+        print('  %-40s %7.2f ms  (%s)' %
+              (key, sum(times.values()) * 1e3,
+               ', '.join('%s %.2f' % (stage, times[stage] * 1e3)
+                         for stage in stages)))
+
+    if json_filename is not None:
+        with open(json_filename, 'w') as f:
+            dump({'repeat': repeat, 'backend': backend, 'units': 's',
+                  'stages': stages,
+                  'totals': totals, 'sketches': results}, f, indent=1)
+        print('Wrote', json_filename)
+
+    return results
+
+
 def main(argv=None):
 
     if argv is None:
@@ -86,6 +186,20 @@ def main(argv=None):
     parser.add_argument('--points', action='store_true',
                         default=False,
                         help="show pins")
+    parser.add_argument('--bench', action='store_true',
+                        default=False,
+                        help="time the sketch loading and drawing stages for all (or the specified) sketch keys")
+    parser.add_argument('--style', type=str, default=None,
+                        help="style for --bench (default all)")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="number of runs for --bench")
+    parser.add_argument('--top', type=int, default=10,
+                        help="number of slowest sketches to show for --bench")
+    parser.add_argument('--json', type=str, default=None,
+                        help="filename to write --bench results as JSON")
+    parser.add_argument('--backend', type=str, default='expat',
+                        choices=SVGParse.backends,
+                        help="SVG parser backend for --bench")
     parser.add_argument('sketch_keys', type=str, nargs='*',
                         help='schematic sketch key(s)', default=[])
 
@@ -94,6 +208,12 @@ def main(argv=None):
     if args.pdb:
         sys.excepthook = schtex_exception
 
+    if args.bench:
+        styles = None if args.style is None else [args.style]
+        sketchbench(args.sketch_keys, styles, args.repeat, args.top,
+                    args.json, args.backend)
+        return 0
+
     for sketch_key in args.sketch_keys:
         sketchview(sketch_key, args.pins, args.points)
 
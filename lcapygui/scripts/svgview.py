@@ -11,7 +11,7 @@ from lcapygui.core import Sketch
 from lcapygui.core.tf import TF
 from lcapygui.ui.tk.sketcher import Sketcher
 from matplotlib.pyplot import subplots, show
-from matplotlib.path import Path
+from os.path import basename, splitext
 
 
 def schtex_exception(type, value, tb):
@@ -38,34 +38,15 @@ def svgview(filename, centre=False, scale=False):
 
     tf = TF()
 
-    xmin = 1000
-    ymin = 1000
-    xmax = -1000
-    ymax = -1000
-    for m, spath in enumerate(sketch.paths):
-        path = spath.path
-        for v, c in zip(path.vertices, path.codes):
-            if c in (Path.MOVETO, Path.LINETO):
-                pos = v
-                if pos[0] > xmax:
-                    xmax = pos[0]
-                if pos[0] < xmin:
-                    xmin = pos[0]
-                if pos[1] > ymax:
-                    ymax = pos[1]
-                if pos[1] < ymin:
-                    ymin = pos[1]
+    xmin, xmax, ymin, ymax = sketch.minmax()
 
     xoff = (xmin + xmax) / 2
     yoff = (ymin + ymax) / 2
     print(xmin, xmax, ymin, ymax, xoff, yoff)
 
     # Some components are asymmetrical and so need to look for wires
-    xoff1, yoff1 = sketch.offsets_find()
-    if xoff1 is not None:
-        xoff, yoff = xoff1, yoff1
-    else:
-        print('Guessing offsets')
+    sketch_key = splitext(basename(filename))[0]
+    xoff, yoff = sketch.offsets(sketch_key)
 
     tf = tf.translate(-xoff, yoff)
 
@@ -1,18 +1,105 @@
 from .core.sketch import Sketch
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 
 
 class SketchLibrary:
 
+    styles = ('american', 'british', 'european')
+
     def __init__(self):
 
+        # Loaded sketches indexed by style then sketch key
         self.sketches = {}
+        # In-flight warm-up loads indexed by (style, sketch_key)
+        self.futures = {}
+        self.executor = None
+        self.lock = Lock()
 
     def _check_style(self, style):
 
-        styles = ('american', 'british', 'european')
-        if style not in styles:
+        if style not in self.styles:
             raise ValueError('Unsupported style %s, must be either %s'
-                             % (style,  ', '.join(styles)))
+                             % (style,  ', '.join(self.styles)))
+
+    def nbytes(self):
+        """
+        Return the number of bytes of path data of the loaded sketches
+        for each style.  The sketches loaded from a bundle have their
+        path data memory-mapped from the bundle file; this counts the
+        mapped address space rather than the resident memory.
+        :rtype: dict[str, int]
+        """
+        with self.lock:
+            return {style: sum(sketch.nbytes for sketch in sketches.values()
+                               if sketch is not None)
+                    for style, sketches in self.sketches.items()}
+
+    def shutdown(self):
+        """
+        Stop the background loading of the sketches.  The loads that
+        have not started are cancelled and this does not wait for the
+        others to finish.
+        """
+        if self.executor is None:
+            return
+
+        with self.lock:
+            futures = list(self.futures.values())
+        for future in futures:
+            future.cancel()
+        self.executor.shutdown(wait=False)
+        self.executor = None
+
+    def sketch_keys(self, style='american'):
+        """
+        Return the sketch keys available for a style.
+        :param str style: The Component Style
+        :rtype: list[str]
+        """
+        from lcapygui import __datadir__
+
+        self._check_style(style)
+
+        dirname = __datadir__ / 'svg' / style
+        return sorted(path.stem for path in dirname.glob('*.svg'))
+
+    def _load(self, sketch_key, style):
+
+        sketch = Sketch.load(sketch_key, style=style, complain=True)
+
+        with self.lock:
+            self.sketches.setdefault(style, {})[sketch_key] = sketch
+            self.futures.pop((style, sketch_key), None)
+        return sketch
+
+    def warmup(self, style='american', max_workers=2):
+        """
+        Load all the sketches for a style in the background.  Lookups
+        of a sketch that is being loaded wait for it to be loaded.
+        :param str style: The Component Style or a list of styles;
+        the styles are loaded in order
+        :param int max_workers: Number of worker threads
+        """
+        if not isinstance(style, str):
+            for style1 in style:
+                self.warmup(style1, max_workers)
+            return
+
+        self._check_style(style)
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix='sketchlib')
+
+        with self.lock:
+            sketches = self.sketches.get(style, {})
+            for sketch_key in self.sketch_keys(style):
+                key = (style, sketch_key)
+                if sketch_key in sketches or key in self.futures:
+                    continue
+                self.futures[key] = self.executor.submit(
+                    self._load, sketch_key, style)
 
     def lookup(self, sketch_key, style='american'):
         """
@@ -24,12 +111,15 @@ class SketchLibrary:
         """
         self._check_style(style)
 
-        if style not in self.sketches:
-            self.sketches[style] = {}
-
-        if sketch_key not in self.sketches[style]:
+        with self.lock:
+            sketches = self.sketches.setdefault(style, {})
+            if sketch_key in sketches:
+                return sketches[sketch_key]
+            future = self.futures.get((style, sketch_key))
 
-            sketch = Sketch.load(sketch_key, style=style, complain=True)
-            self.sketches[style][sketch_key] = sketch
+        # If the sketch is queued for warm-up but not started, it
+        # is quicker to load it now than to wait for the queue.
+        if future is not None and not future.cancel():
+            return future.result()
 
-        return self.sketches[style][sketch_key]
+        return self._load(sketch_key, style)
@@ -0,0 +1,66 @@
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.pyplot import close, subplots
+from types import SimpleNamespace
+from lcapy import Circuit
+import pytest
+
+from lcapygui.sketch_library import SketchLibrary
+from lcapygui.ui.tk.sketcher import Sketcher
+from lcapygui.ui.uimodeldnd import UIModelDnD
+
+
+class UI:
+    """Headless user interface.  If `view` is not None, only the
+    components in the view are drawn."""
+
+    debug = 0
+    popup_menu = None
+
+    def __init__(self):
+
+        self.fig, self.ax = subplots()
+        self.canvas = SimpleNamespace(drawing=SimpleNamespace(
+            ax=self.ax, xsize=36, ysize=22))
+        self.sketcher = Sketcher(self.ax)
+        self.sketchlib = SketchLibrary()
+        self.view = None
+
+    def clear(self, grid='on'):
+
+        self.ax.clear()
+
+    def get_view(self):
+
+        return self.view
+
+    def show_error_dialog(self, message):
+
+        raise RuntimeError(message)
+
+    def __getattr__(self, name):
+
+        # Ignore the dialogs, refreshes, and so on.
+        return lambda *args, **kwargs: None
+
+
+@pytest.fixture
+def make_model():
+    """Return a function that makes a model, drawn with a headless
+    user interface, for a netlist."""
+
+    uis = []
+
+    def make(netlist):
+
+        ui = UI()
+        uis.append(ui)
+        model = UIModelDnD(ui)
+        ui.model = model
+        model.load_from_circuit(Circuit(netlist))
+        return ui, model
+
+    yield make
+
+    for ui in uis:
+        close(ui.fig)
@@ -0,0 +1,92 @@
+from numpy import isclose, isinf
+from random import Random
+
+
+NETLIST = '''
+V1 1 0; down
+R1 1 2; right
+L1 2 3; right
+C1 3 0_3; down
+W 0 0_2; right
+W 0_2 0_3; right
+D1 2 0_2; down
+E1 8 9 opamp 3 0_3; right
+W 1 10; up
+R2 10 11; up
+R3 12 11; left
+W 12 13; down
+Q1 14 13 15 npn; right
+W 11 16; right
+R4 16 17; rotate=45
+M1 18 17 19 nmos; right, mirror
+'''
+
+
+def random_points(model, seed):
+
+    random = Random(seed)
+    for cpt in model.circuit.elements.values():
+        xmin, ymin, xmax, ymax = cpt.gcpt.extent
+        for m in range(50):
+            yield (random.uniform(xmin - 1, xmax + 1),
+                   random.uniform(ymin - 1, ymax + 1))
+
+
+def check_table(model, seed):
+
+    model.cpt_index_sync()
+    cpts = [cpt for cpt in model.circuit.elements.values()
+            if hasattr(cpt.gcpt, 'bbox_path')]
+    assert all(cpt in model.cpt_table for cpt in cpts)
+
+    nhits = 0
+    for x, y in random_points(model, seed):
+        within = model.cpt_table.contains_point(cpts, x, y)
+        distances = model.cpt_table.segment_distances(cpts, x, y)
+        for cpt, hit, distance in zip(cpts, within, distances):
+            gcpt = cpt.gcpt
+            assert hit == gcpt.is_within_bbox(x, y), (cpt, x, y)
+            nhits += hit
+
+            if not gcpt.node1.is_drawn or not gcpt.node2.is_drawn:
+                continue
+            expected = gcpt.distance_from_cpt(x, y)
+            if expected == 100:
+                assert isinf(distance), (cpt, x, y)
+            else:
+                assert isclose(distance, expected), (cpt, x, y)
+    assert nhits > 0
+
+
+def test_table_matches_cpts(make_model):
+    """Check that the hit-tests with the component table match the
+    tests for each component, also after the nodes are moved and a
+    component is deleted."""
+
+    ui, model = make_model(NETLIST)
+    check_table(model, 1)
+
+    for name in ('2', '11', '17'):
+        node = model.circuit.nodes[name]
+        model.node_move(node, node.pos.x + 0.5, node.pos.y + 1)
+    model.redraw_dirty()
+    check_table(model, 2)
+
+    model.cpt_delete(model.circuit['R2'])
+    assert model.circuit['R1'] in model.cpt_table
+    assert all(cpt.name != 'R2' for cpt in model.cpt_table.rows)
+    check_table(model, 3)
+
+
+def test_cpts_within(make_model):
+    """Check the components found for a rubber-band selection."""
+
+    ui, model = make_model(NETLIST)
+
+    xmin, ymin, xmax, ymax = model.circuit['R1'].gcpt.extent
+    bbox = (xmin - 0.1, ymin - 0.1, xmax + 0.1, ymax + 0.1)
+    assert model.cpts_within(bbox) == [model.circuit['R1']]
+
+    expected = [cpt for cpt in model.circuit.elements.values()
+                if cpt.gcpt.extent is not None]
+    assert model.cpts_within((-100, -100, 100, 100)) == expected
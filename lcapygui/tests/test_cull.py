@@ -0,0 +1,32 @@
+def test_delete_next_to_culled(make_model):
+    """Check that a component next to a component that is not drawn,
+    since it is out of view, can be deleted."""
+
+    # A chain of cells, each a source and a long wire.
+    lines = []
+    for k in range(1, 13):
+        lines.append('V%d %d %d; right' % (k, 2 * k - 1, 2 * k))
+        lines.append('W%d %d %d; right=4' % (k, 2 * k, 2 * k + 1))
+    ui, model = make_model('\n'.join(lines))
+
+    # Only show the middle of W9 so that its neighbours are culled.
+    wire = model.circuit['W9']
+    x = (wire.nodes[0].pos.x + wire.nodes[1].pos.x) / 2
+    y = wire.nodes[0].pos.y
+    ui.view = (x - 0.5, y - 0.5, x + 0.5, y + 0.5)
+    model.on_redraw()
+
+    assert model.circuit['V9'] in model.culled
+    assert model.circuit['V10'] in model.culled
+    assert wire not in model.culled
+
+    model.select(wire)
+    model.on_delete()
+    assert 'W9' not in model.circuit.elements
+
+    # The culled components are drawn when they come into view.
+    ui.view = None
+    model.redraw_visible()
+    model.undo()
+    model.on_redraw_dirty()
+    assert 'W9' in model.circuit.elements
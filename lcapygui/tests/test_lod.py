@@ -0,0 +1,41 @@
+def zoom(ui, model, scale):
+    """Zoom the view about its centre by `scale`."""
+
+    xmin, xmax = ui.ax.get_xlim()
+    ymin, ymax = ui.ax.get_ylim()
+    xc, yc = (xmin + xmax) / 2, (ymin + ymax) / 2
+    dx, dy = (xmax - xmin) / 2 / scale, (ymax - ymin) / 2 / scale
+    ui.ax.set_xlim(xc - dx, xc + dx)
+    ui.ax.set_ylim(yc - dy, yc + dy)
+    model.on_view_change(ui.ax)
+
+
+def test_restyle_outline(make_model):
+    """Check that the style can be changed after zooming out so far
+    that the components are drawn as outlines."""
+
+    ui, model = make_model('V1 1 0; down\n'
+                           'L1 1 2; right\n'
+                           'W 2 0_2; down\n'
+                           'W 0 0_2; right')
+    model.preferences.style = 'american'
+    model.on_redraw()
+    ui.ax.set_xlim(0, model.preferences.xsize)
+    ui.ax.set_ylim(0, model.preferences.ysize)
+    model.on_view_change(ui.ax)
+
+    zoom(ui, model, model.OUTLINE_ZOOM / 2)
+    assert model.lod == 'outline'
+
+    npatches = len(ui.ax.patches)
+    model.preferences.style = 'european'
+    model.restyle()
+    ui.fig.canvas.draw()
+    # Only the outlines are drawn so nothing is restyled.
+    assert len(ui.ax.patches) == npatches
+
+    zoom(ui, model, 4 / model.OUTLINE_ZOOM)
+    assert model.lod == 'full'
+    for name in ('V1', 'L1'):
+        gcpt = model.circuit[name].gcpt
+        assert gcpt.sketch is ui.sketchlib.lookup(gcpt.sketch_key, 'european')
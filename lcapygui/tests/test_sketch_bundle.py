@@ -0,0 +1,56 @@
+from os import utime
+from numpy import array_equal
+import pytest
+
+from lcapygui.core.sketch import Sketch
+from lcapygui.core.sketch_bundle import SketchBundle
+from lcapygui.sketch_library import SketchLibrary
+
+
+@pytest.mark.parametrize('style', SketchLibrary.styles)
+def test_bundle_matches_svg(style):
+    """Check that the sketches in the bundle match the sketches made
+    from the SVG files."""
+
+    bundle = SketchBundle.load(style)
+    assert bundle is not None
+
+    dirname = SketchBundle.dirname(style)
+    for sketch_key in SketchLibrary().sketch_keys(style):
+        svg_filename = dirname / (sketch_key + '.svg')
+        sketch1 = bundle.lookup(sketch_key, svg_filename)
+        sketch2 = Sketch.load_svg(sketch_key, style)
+
+        assert sketch1 is not None, sketch_key
+        assert (sketch1.width, sketch1.height) == \
+            (sketch2.width, sketch2.height), sketch_key
+        assert len(sketch1.paths) == len(sketch2.paths), sketch_key
+        for spath1, spath2 in zip(sketch1.paths, sketch2.paths):
+            assert array_equal(spath1.path.vertices,
+                               spath2.path.vertices), sketch_key
+            assert array_equal(spath1.path.codes,
+                               spath2.path.codes), sketch_key
+            assert spath1.fill == spath2.fill, sketch_key
+            assert spath1.symbol == spath2.symbol, sketch_key
+
+
+def test_bundle_stale(tmp_path):
+    """Check that an SVG file with a different modification time is
+    only used if its contents are unchanged."""
+
+    bundle = SketchBundle.load('american')
+    sketch_key = 'R'
+    entry = bundle.header['sketches'][sketch_key]
+    svg_filename = SketchBundle.dirname('american') / (sketch_key + '.svg')
+
+    copy_filename = tmp_path / (sketch_key + '.svg')
+    copy_filename.write_bytes(svg_filename.read_bytes())
+    utime(copy_filename, ns=(entry['mtime'] + 10**9, entry['mtime'] + 10**9))
+    bundle.verified.clear()
+
+    assert bundle.is_current(sketch_key, entry, copy_filename)
+    assert sketch_key in bundle.verified
+
+    copy_filename.write_bytes(svg_filename.read_bytes() + b'\n')
+    assert not bundle.is_current(sketch_key, entry, copy_filename)
+    bundle.verified.clear()
@@ -0,0 +1,121 @@
+from matplotlib.path import Path
+import pytest
+
+from lcapygui.core.sketch import Sketch
+from lcapygui.core.sketch_bundle import SketchBundle
+from lcapygui.sketch_library import SketchLibrary
+
+
+# These are the original per-vertex implementations that the Sketch
+# methods are checked against.
+
+def ref_horizontal_wire_pair_offsets(sketch):
+
+    candidates = []
+    for path in sketch.paths:
+        if len(path.path) >= 4 and all(path.path.codes[0:4] == (1, 2, 1, 2)):
+            vertices = path.path.vertices
+            if vertices[0][1] == vertices[1][1]:
+                xoffset = vertices[0][0]
+                yoffset = vertices[0][1]
+                candidates.append((xoffset, yoffset))
+
+    if candidates == []:
+        return None, None
+
+    xmin = 1000
+    yoffset = 0
+    for candidate in candidates:
+        if candidate[0] < xmin:
+            xmin = candidate[0]
+            yoffset = candidate[1]
+
+    return sketch.width / 2, yoffset
+
+
+def ref_vertical_wire_pair_offsets(sketch):
+
+    candidates = []
+    for path in sketch.paths:
+        if len(path.path) >= 4 and all(path.path.codes[0:4] == (1, 2, 1, 2)):
+            vertices = path.path.vertices
+            if vertices[0][0] == vertices[1][0]:
+                xoffset = vertices[0][0]
+                yoffset = vertices[0][1]
+                candidates.append((xoffset, yoffset))
+
+    if candidates == []:
+        return None, None
+
+    ymin = 1000
+    for candidate in candidates:
+        if candidate[1] < ymin:
+            ymin = candidate[1]
+            xoffset = candidate[0]
+
+    return xoffset, sketch.height / 2
+
+
+def ref_vertical_wire_offsets(sketch):
+
+    for path in sketch.paths:
+        if len(path.path) == 2 and all(path.path.codes == (1, 2)):
+            vertices = path.path.vertices
+            if vertices[0][0] == vertices[1][0]:
+                return vertices[0][0], vertices[0][1]
+
+    return None, None
+
+
+def ref_horizontal_wire_offsets(sketch):
+
+    for path in sketch.paths:
+        if len(path.path) == 2 and all(path.path.codes == (1, 2)):
+            vertices = path.path.vertices
+            if vertices[0][1] == vertices[1][1]:
+                return sketch.width / 2, vertices[0][1]
+
+    return None, None
+
+
+def ref_minmax(sketch):
+
+    xmin = 1000
+    ymin = 1000
+    xmax = -1000
+    ymax = -1000
+    for spath in sketch.paths:
+        path = spath.path
+        for v, c in zip(path.vertices, path.codes):
+            if c in (Path.MOVETO, Path.LINETO):
+                pos = v
+                if pos[0] > xmax:
+                    xmax = pos[0]
+                if pos[0] < xmin:
+                    xmin = pos[0]
+                if pos[1] > ymax:
+                    ymax = pos[1]
+                if pos[1] < ymin:
+                    ymin = pos[1]
+
+    return xmin, xmax, ymin, ymax
+
+
+references = {'horizontal_wire_pair_offsets': ref_horizontal_wire_pair_offsets,
+              'vertical_wire_pair_offsets': ref_vertical_wire_pair_offsets,
+              'vertical_wire_offsets': ref_vertical_wire_offsets,
+              'horizontal_wire_offsets': ref_horizontal_wire_offsets,
+              'minmax': ref_minmax}
+
+
+@pytest.mark.parametrize('style', SketchLibrary.styles)
+def test_offsets_match(style):
+    """Check that the offsets and bounds found by Sketch match the
+    per-vertex loop implementations for every sketch SVG file."""
+
+    dirname = SketchBundle.dirname(style)
+    for svg_filename in sorted(dirname.glob('*.svg')):
+        sketch = Sketch.load_file(str(svg_filename))
+        for name, reference in references.items():
+            assert getattr(sketch, name)() == reference(sketch), \
+                '%s/%s: %s' % (style, svg_filename.stem, name)
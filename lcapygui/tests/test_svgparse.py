@@ -0,0 +1,30 @@
+from numpy import array_equal
+import pytest
+
+from lcapygui import __datadir__
+from lcapygui.core.svgparse import SVGParse
+
+
+filenames = sorted((__datadir__ / 'svg').glob('*/*.svg'))
+
+
+@pytest.mark.parametrize('backend', SVGParse.backends[1:])
+def test_backends_match(backend):
+    """Check that each backend parses the sketch SVG files the same as
+    the reference backend."""
+
+    reference = SVGParse.backends[0]
+    for filename in filenames:
+        svg1 = SVGParse(str(filename), backend=reference)
+        svg2 = SVGParse(str(filename), backend=backend)
+
+        assert (svg1.width, svg1.height) == (svg2.width, svg2.height), \
+            filename
+        assert len(svg1.paths) == len(svg2.paths), filename
+        for path1, path2 in zip(svg1.paths, svg2.paths):
+            assert array_equal(path1.path.vertices,
+                               path2.path.vertices), filename
+            assert array_equal(path1.path.codes, path2.path.codes), filename
+            assert array_equal(path1.transform, path2.transform), filename
+            assert path1.style == path2.style, filename
+            assert path1.symbol == path2.symbol, filename
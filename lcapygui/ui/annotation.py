@@ -31,6 +31,12 @@ class Annotation:
         if self.patch:
             self.patch.remove()
 
+    def set_visible(self, visible):
+
+        # The annotation may not have been drawn.
+        if self.patch is not None:
+            self.patch.set_visible(visible)
+
     @classmethod
     def make_label(cls, ui, pos, angle, scale, offset, alignment, text):
 
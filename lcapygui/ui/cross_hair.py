@@ -119,6 +119,8 @@ class CrossHair:
                     self.x - 0.5 * scale, self.y, self.x - 0.2 * scale, self.y,
                     linewidth=line_width, color=line_color))
 
+        # The crosshair is redrawn by blitting when the mouse moves.
+        self.model.ui.add_overlay(self.picture)
 
     def undraw(self):
         """
@@ -163,4 +165,4 @@ class CrossHair:
 
         # Redraw the component
         self.redraw()
-        self.model.ui.refresh()
+        self.model.ui.refresh_overlay()
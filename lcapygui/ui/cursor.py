@@ -4,6 +4,7 @@ class Cursor:
 
     def __init__(self, ui, x, y):
 
+        self.ui = ui
         self.sketcher = ui.sketcher
         self.positive_colour = ui.model.preferences.color('positive')
         self.negative_colour = ui.model.preferences.color('negative')
@@ -45,6 +46,8 @@ class Cursor:
                 linewidth=1.5
             ))
 
+        self.ui.add_overlay(self.picture)
+
     def remove(self):
         if self.picture is not None:
             self.picture.remove()
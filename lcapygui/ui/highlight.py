@@ -28,6 +28,8 @@ class Highlight:
                 alpha=0.5
             ))
 
+        self.ui.add_overlay(self.picture)
+
         self.cpt = cpt
 
     def remove(self):
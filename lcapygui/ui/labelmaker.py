@@ -1,5 +1,6 @@
 # This is a copy of the Lcapy version.  Remove once Lcapy updated.
 
+from functools import lru_cache
 from lcapy.expr import Expr
 from lcapy.latex import latex_format_label
 from lcapy.valueformatter import value_formatter
@@ -7,6 +8,10 @@ from lcapy.valueparser import value_parser
 import sympy as sym
 
 
+# Maximum number of component labels that are remembered
+LABEL_CACHE_SIZE = 4096
+
+
 class LabelMaker:
 
     def _format_expr(self, expr):
@@ -35,56 +40,71 @@ class LabelMaker:
 
     def make(self, cpt, label_ports=False, style='SI'):
 
+        # Formatting the value is slow since it is parsed by sympy so
+        # the labels are remembered.
+        return self._make_cached(cpt.type, cpt.id, cpt.classname,
+                                 tuple(cpt.args), label_ports, style)
+
+    @classmethod
+    @lru_cache(maxsize=LABEL_CACHE_SIZE)
+    def _make_cached(cls, cpt_type, cpt_id, classname, args, label_ports,
+                     style):
+
+        return cls()._make(cpt_type, cpt_id, classname, args, label_ports,
+                           style)
+
+    def _make(self, cpt_type, cpt_id, classname, args, label_ports, style):
+
         # There are two possible labels for a component:
         # 1. Component name, e.g., R1
         # 2. Component value, expression, or symbol
 
-        id_label = self._format_name(cpt.type, cpt.id)
+        id_label = self._format_name(cpt_type, cpt_id)
         value_label = None
 
-        if cpt.type == 'P' and not label_ports:
+        if cpt_type == 'P' and not label_ports:
             id_label = None
 
-        elif cpt.type in ('A', 'O', 'W') or id_label.find('#') != -1:
+        elif cpt_type in ('A', 'O', 'W') or id_label.find('#') != -1:
             id_label = None
 
-        if cpt.type in ('A', 'S', 'SW', 'U'):
+        if cpt_type in ('A', 'S', 'SW', 'U'):
             value_label = ''
 
         unify = False
-        if len(cpt.args):
+        if len(args):
 
             # TODO, extend for mechanical and acoustical components.
             units_map = {'V': 'V', 'I': 'A', 'R': '$\Omega$',
                          'C': 'F', 'L': 'H'}
 
-            expr = value_parser(cpt.args[0])
+            expr = value_parser(args[0])
 
-            if cpt.classname in ('Vstep', 'Istep'):
+            if classname in ('Vstep', 'Istep'):
                 expr = '(%s) * Heaviside(t)' % expr
                 value_label = self._format_expr(expr)
-            elif cpt.classname in ('Vs', 'Is'):
+            elif classname in ('Vs', 'Is'):
                 value_label = self._format_expr(expr)
-            elif cpt.classname == 'TF':
+            elif classname == 'TF':
                 expr = sym.sympify(expr)
                 if expr.is_Pow and expr.args[1] == -1:
                     value_label = '%s:1' % (1 / expr)
                 else:
                     value_label = '1:%s' % expr
-            elif cpt.type in ('F', 'H') and len(cpt.args) > 1:
+            elif cpt_type in ('F', 'H') and len(args) > 1:
                 # This is hard to give a reasonable label since the
                 # control current is specified by a voltage source.
                 # The user will have to override manually.
-                expr = cpt.args[1]
+                expr = args[1]
                 value_label = self._format_expr(expr)
-            elif cpt.classname not in ('TP',):
+            elif classname not in ('TP',):
                 try:
                     # Handle things like 9/1000 that can occur
                     # when substituting cpt values.
                     value = float(sym.Rational(expr))
-                    if cpt.type in units_map:
+                    if cpt_type in units_map:
                         value_label = self._format_value_units(
-                            value, units_map[cpt.type], style)
+                            value, units_map[cpt_type], style)
                     else:
                         value_label = self._format_expr(expr)
 
@@ -94,7 +114,7 @@ class LabelMaker:
 
             # Ensure labels are the same when the value is not specified.
             # This will prevent printing the name and value.
-            unify = expr == cpt.type + cpt.id
+            unify = expr == cpt_type + cpt_id
 
             # Currently, we only annnotate the component with the
             # value, expression, or symbol.  If this is not specified,
@@ -12,6 +12,9 @@ class Preferences:
     circuitikz_default_cpt_size = 1.5
     circuitikz_default_font_size = 12
 
+    # Preferences that do not change how the schematic is drawn
+    not_drawn = ('current_sign_convention', 'hide_labels', 'snap_grid')
+
     # For compatible colours, see https://matplotlib.org/stable/gallery/color/named_colors.html
     # mpl stylesheets available here, https://matplotlib.org/stable/gallery/style_sheets/style_sheets_reference.html
     color_schemes = {
@@ -74,6 +77,8 @@ class Preferences:
         self.xsize = 16
         self.ysize = 10
         self.snap_grid = 'true'
+        # Hide the labels while dragging or panning
+        self.hide_labels = 'false'
         # This is the scaling used to set the matplotlib line width
         # from the circuitikz line width.
         self.line_width_scale = 1.01 * 2.5
@@ -0,0 +1,218 @@
+"""
+This defines collections that draw many line segments or node markers
+as a single matplotlib artist.  Each segment or marker is addressed by
+its index in the collection and is represented by a BatchItem that has
+the parts of the artist interface used by the components.
+"""
+
+from abc import ABC, abstractmethod
+from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.colors import to_rgba
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
+from matplotlib.path import Path
+from numpy import array, nan
+
+
+# A path that draws nothing; this fills the slots of removed items.
+EMPTY_PATH = Path(array(((nan, nan), (nan, nan))))
+
+
+class Batch(ABC):
+    """Mixin for a collection with items that can be added, changed, and
+    removed by index.  Removed items leave a hole that is reused.  The
+    item styles are gathered into the collection when it is drawn so
+    that adding many items is not quadratic."""
+
+    def _init_batch(self, **styles):
+
+        # Indices of removed items that can be reused
+        self.free_items = []
+        # Style name to list of values, one per item
+        self.item_styles = {name: [] for name in styles}
+        self.empty_styles = styles
+        self.restyled = False
+
+    def add_item(self, path, **styles):
+
+        paths = self.get_paths()
+        if self.free_items:
+            index = self.free_items.pop()
+            paths[index] = path
+            for name, values in self.item_styles.items():
+                values[index] = styles[name]
+        else:
+            index = len(paths)
+            paths.append(path)
+            for name, values in self.item_styles.items():
+                values.append(styles[name])
+
+        self.restyled = True
+        self.stale = True
+        return index
+
+    def set_item_path(self, index, path):
+
+        self.get_paths()[index] = path
+        self.stale = True
+
+    def get_item_path(self, index):
+
+        return self.get_paths()[index]
+
+    def remove_item(self, index):
+
+        self.get_paths()[index] = EMPTY_PATH
+        for name, values in self.item_styles.items():
+            values[index] = self.empty_styles[name]
+        self.free_items.append(index)
+        self.restyled = True
+        self.stale = True
+
+    def scale_items(self, name, scale):
+        """Multiply the style `name` of every item by `scale`."""
+
+        self.item_styles[name] = [value * scale
+                                  for value in self.item_styles[name]]
+        self.restyled = True
+        self.stale = True
+
+    @property
+    def nitems(self):
+
+        return len(self.get_paths()) - len(self.free_items)
+
+    @abstractmethod
+    def apply_styles(self):
+        """Set the collection styles from the item styles."""
+
+    def draw(self, renderer):
+
+        if self.restyled:
+            self.apply_styles()
+            self.restyled = False
+        super().draw(renderer)
+
+
+class LineBatch(Batch, LineCollection):
+    """Line segments, such as wires and component leads, with their own
+    colour, line width, and line style."""
+
+    def __init__(self, **kwargs):
+
+        # Line2D uses projecting caps for solid lines so that wires
+        # meeting at a corner are joined.
+        kwargs.setdefault('capstyle', 'projecting')
+        kwargs.setdefault('zorder', Line2D.zorder)
+        super().__init__([], **kwargs)
+        self._init_batch(color=(0, 0, 0, 0), lw=0, linestyle='solid')
+
+    def add_segment(self, xstart, ystart, xend, yend, color='black',
+                    lw=1.5, linestyle='solid'):
+
+        path = Path(array(((xstart, ystart), (xend, yend)), dtype=float))
+        return self.add_item(path, color=to_rgba(color), lw=lw,
+                             linestyle=linestyle)
+
+    def apply_styles(self):
+
+        self.set_color(self.item_styles['color'])
+        self.set_linewidth(self.item_styles['lw'])
+        self.set_linestyle(self.item_styles['linestyle'])
+
+
+class MarkerBatch(Batch, PatchCollection):
+    """Circular markers, such as node dots, with their own radius and
+    colours.  The markers are sized in data units."""
+
+    def __init__(self, **kwargs):
+
+        # The markers are drawn over the sketch patches, as the
+        # separate circles were since they were added after the
+        # sketches, but under the wires.
+        kwargs.setdefault('zorder', (Patch.zorder + Line2D.zorder) / 2)
+        super().__init__([], **kwargs)
+        self._init_batch(fc=(0, 0, 0, 0), ec=(0, 0, 0, 0), lw=0)
+
+    def add_marker(self, x, y, radius, fc='black', ec='none', lw=1):
+
+        return self.add_item(self.circle_path(x, y, radius),
+                             fc=to_rgba(fc), ec=to_rgba(ec), lw=lw)
+
+    @staticmethod
+    def circle_path(x, y, radius):
+
+        circle = Path.unit_circle()
+        return Path(circle.vertices * radius + (x, y), circle.codes)
+
+    def apply_styles(self):
+
+        self.set_facecolor(self.item_styles['fc'])
+        self.set_edgecolor(self.item_styles['ec'])
+        self.set_linewidth(self.item_styles['lw'])
+
+
+class BatchItem:
+    """A segment or marker in a batch.  This can be removed and moved
+    like the artist it replaces."""
+
+    def __init__(self, batch, index):
+
+        self.batch = batch
+        self.index = index
+
+    @property
+    def path(self):
+
+        return self.batch.get_item_path(self.index)
+
+    @property
+    def is_drawn(self):
+
+        # The batch is discarded when the axes are cleared.
+        return self.index is not None and self.batch.axes is not None
+
+    def remove(self):
+
+        if self.is_drawn:
+            self.batch.remove_item(self.index)
+        self.index = None
+
+    def translate(self, dx, dy):
+
+        path = self.path
+        self.batch.set_item_path(self.index,
+                                 Path(path.vertices + (dx, dy), path.codes))
+
+
+class SegmentItem(BatchItem):
+
+    def get_data(self):
+
+        vertices = self.path.vertices
+        return vertices[:, 0], vertices[:, 1]
+
+    def set_data(self, xdata, ydata):
+
+        self.batch.set_item_path(self.index,
+                                 Path(array((xdata, ydata), dtype=float).T))
+
+
+class MarkerItem(BatchItem):
+
+    def __init__(self, batch, index, center, radius):
+
+        super().__init__(batch, index)
+        self.center = center
+        self.radius = radius
+
+    def set_center(self, xy):
+
+        self.center = tuple(xy)
+        self.batch.set_item_path(self.index,
+                                 MarkerBatch.circle_path(*xy, self.radius))
+
+    def translate(self, dx, dy):
+
+        x, y = self.center
+        self.set_center((x + dx, y + dy))
@@ -1,4 +1,5 @@
-from numpy import arange
+from weakref import WeakSet
+from .grid_lines import GridLines
 
 
 class Drawing():
@@ -23,6 +24,17 @@ class Drawing():
 
         self.ax = self.fig.add_subplot(111)
 
+        # Artists, such as the crosshair, that are drawn over a cached
+        # background when the mouse moves rather than redrawing
+        # everything.  Artists are removed when they are deleted.
+        self.overlay = WeakSet()
+        self.background = None
+        self.fig.canvas.mpl_connect('draw_event', self.on_draw)
+
+        # The grid lines are kept when the axes are cleared and only
+        # remade if the grid spacing or colour changes.
+        self.grid_lines = None
+
         self.draw_grid('on')
         self.set_default_view()
 
@@ -32,25 +44,26 @@ class Drawing():
             print('draw grid')
 
         scale = self.ui.model.preferences.grid_spacing
-        xticks = arange(self.xmin, self.xmax + 1) * scale
-        yticks = arange(self.xmin, self.ymax + 1) * scale
+        color = self.ui.model.preferences.color("grid")
 
+        # The grid is drawn as a collection of lines rather than with
+        # axis ticks since matplotlib lays out the ticks on every draw.
         self.ax.axis('equal')
-        self.ax.set_xticks(xticks)
-        self.ax.set_yticks(yticks)
-        self.ax.set_xticklabels([])
-        self.ax.set_yticklabels([])
+        self.ax.set_xticks([])
+        self.ax.set_yticks([])
 
         self.ax.set_facecolor(self.ui.model.preferences.color("background"))
 
         if grid == 'on':
-            self.ax.grid(color= self.ui.model.preferences.color("grid"))
+            if (self.grid_lines is None or
+                    not self.grid_lines.matches(scale, color)):
+                self.grid_lines = GridLines(scale, self.xmin, self.ymin,
+                                            self.xmax, self.ymax, color)
+            self.ax.add_collection(self.grid_lines, autolim=False)
 
         self.ax.tick_params(which='both', left=False, bottom=False,
                             top=False, labelbottom=False)
 
-        self.ax.set_axisbelow(True)
-
     def savefig(self, filename):
 
         self.fig.savefig(filename, bbox_inches='tight', pad_inches=0)
@@ -77,6 +90,12 @@ class Drawing():
         self.ax.set_xlim(xmin, xmax, emit=False)
         self.ax.set_ylim(ymin, ymax, emit=False)
 
+    def get_view(self):
+
+        xmin, xmax = self.ax.get_xlim()
+        ymin, ymax = self.ax.get_ylim()
+        return xmin, ymin, xmax, ymax
+
     def set_default_view(self):
 
         self.set_view(0, 0, self.xsize, self.ysize)
@@ -103,3 +122,41 @@ class Drawing():
         if self.debug:
             print('refresh')
         self.fig.canvas.draw()
+
+    def add_overlay(self, artists):
+
+        for artist in artists:
+            artist.set_animated(True)
+            self.overlay.add(artist)
+
+    def draw_overlay(self):
+
+        # Artists removed from the axes have axes set to None.
+        artists = [artist for artist in self.overlay
+                   if artist.axes is self.ax and artist.get_animated()]
+        for artist in sorted(artists, key=lambda artist: artist.zorder):
+            self.ax.draw_artist(artist)
+
+    def on_draw(self, event):
+
+        # Animated artists are not drawn by a full redraw so cache
+        # the background and then draw the overlay.
+        self.background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        self.draw_overlay()
+
+    def invalidate_background(self):
+
+        # The cached background is stale when anything other than the
+        # overlay changes so the next overlay refresh draws everything.
+        self.background = None
+
+    def refresh_overlay(self):
+
+        if self.background is None:
+            self.refresh()
+            return
+
+        canvas = self.fig.canvas
+        canvas.restore_region(self.background)
+        self.draw_overlay()
+        canvas.blit(self.fig.bbox)
@@ -0,0 +1,88 @@
+"""
+This defines the background grid as a single collection of lines.  The
+lines only cover the region around the view; they are recomputed when
+they are drawn if the view has moved outside this region or the view
+has shrunk so much that most of the lines are not visible.
+"""
+
+from math import ceil, floor
+from matplotlib import rcParams
+from matplotlib.collections import LineCollection
+
+
+class GridLines(LineCollection):
+    """Grid lines spaced by `spacing` at the multiples of `spacing`
+    between `xmin` and `xmax` and between `ymin` and `ymax`.  These
+    are given in grid units."""
+
+    # Number of view widths (and heights) covered by the lines
+    COVER = 3
+
+    def __init__(self, spacing, xmin, ymin, xmax, ymax, color='lightblue',
+                 **kwargs):
+
+        # Same style as the axes grid lines drawn below everything else
+        kwargs.setdefault('lw', rcParams['grid.linewidth'])
+        kwargs.setdefault('linestyle', rcParams['grid.linestyle'])
+        kwargs.setdefault('zorder', 0.5)
+        super().__init__([], color=color, **kwargs)
+
+        self.spacing = spacing
+        self.color = color
+        self.limits = xmin, ymin, xmax, ymax
+        # Region (xmin, ymin, xmax, ymax) covered by the lines
+        self.covered = None
+
+    def matches(self, spacing, color):
+
+        return spacing == self.spacing and color == self.color
+
+    def _needs_update(self, view):
+
+        if self.covered is None:
+            return True
+
+        xmin, ymin, xmax, ymax = view
+        cxmin, cymin, cxmax, cymax = self.covered
+        if xmin < cxmin or ymin < cymin or xmax > cxmax or ymax > cymax:
+            return True
+
+        # Zoomed in so far that most of the lines are out of view
+        return (cxmax - cxmin) > 2 * self.COVER * (xmax - xmin)
+
+    def update_lines(self, view):
+
+        xmin, ymin, xmax, ymax = view
+        width = xmax - xmin
+        height = ymax - ymin
+        margin = (self.COVER - 1) / 2
+        cxmin = xmin - margin * width
+        cxmax = xmax + margin * width
+        cymin = ymin - margin * height
+        cymax = ymax + margin * height
+
+        spacing = self.spacing
+        kxmin, kymin, kxmax, kymax = self.limits
+        kxmin = max(kxmin, ceil(cxmin / spacing))
+        kxmax = min(kxmax, floor(cxmax / spacing))
+        kymin = max(kymin, ceil(cymin / spacing))
+        kymax = min(kymax, floor(cymax / spacing))
+
+        segments = []
+        for k in range(kxmin, kxmax + 1):
+            x = k * spacing
+            segments.append(((x, cymin), (x, cymax)))
+        for k in range(kymin, kymax + 1):
+            y = k * spacing
+            segments.append(((cxmin, y), (cxmax, y)))
+
+        self.set_segments(segments)
+        self.covered = cxmin, cymin, cxmax, cymax
+
+    def draw(self, renderer):
+
+        (xmin, ymin), (xmax, ymax) = self.axes.viewLim.get_points()
+        view = xmin, ymin, xmax, ymax
+        if self._needs_update(view):
+            self.update_lines(view)
+        super().draw(renderer)
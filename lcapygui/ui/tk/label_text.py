@@ -0,0 +1,123 @@
+"""
+This defines text that is drawn from a cached image.  Matplotlib
+parses and lays out mathtext every time a text artist is drawn and
+only caches the last few parses, so a schematic with many labels is
+slow to redraw.  Here each label is rendered once to an image and the
+image is reused until the text, font, or colour changes.
+"""
+
+from collections import OrderedDict
+from math import ceil, floor
+from matplotlib.artist import allow_rasterization
+from matplotlib.backends.backend_agg import RendererAgg
+from matplotlib.colors import to_rgba
+from matplotlib.text import Text
+from matplotlib.transforms import IdentityTransform
+from numpy import asarray
+
+
+class TextImages:
+    """Cache of rendered text images.  The least recently used images
+    are discarded when there are more than `size` of them."""
+
+    def __init__(self, size=2000):
+
+        self.size = size
+        self.images = OrderedDict()
+
+    def __len__(self):
+
+        return len(self.images)
+
+    def clear(self):
+
+        self.images.clear()
+
+    def get(self, key):
+
+        image = self.images.get(key)
+        if image is not None:
+            self.images.move_to_end(key)
+        return image
+
+    def add(self, key, image):
+
+        self.images[key] = image
+        if len(self.images) > self.size:
+            self.images.popitem(last=False)
+
+
+class LabelText(Text):
+    """Text positioned in data coordinates that is drawn from an image
+    in `images`.  Like an annotation, the text is not drawn if its
+    position is outside the axes.  Text for other renderers, such as
+    for saving as PDF, is drawn as usual."""
+
+    # Margin in pixels around the rendered text
+    PAD = 2
+
+    def __init__(self, x, y, text, images, **kwargs):
+
+        super().__init__(x, y, text, **kwargs)
+        self.images = images
+
+    def _image_key(self, renderer):
+
+        return (self.get_text(), hash(self.get_fontproperties()),
+                to_rgba(self.get_color(), self.get_alpha()), self.get_ha(),
+                self.get_va(), self.get_rotation(), self.get_linespacing(),
+                renderer.dpi)
+
+    def _render_image(self, renderer):
+        """Return the rendered text as an RGBA array and the offset of
+        its bottom left corner from the text position in pixels."""
+
+        text = Text(0, 0, self.get_text(), color=self.get_color(),
+                    alpha=self.get_alpha(),
+                    fontproperties=self.get_fontproperties(),
+                    ha=self.get_ha(), va=self.get_va(),
+                    rotation=self.get_rotation(),
+                    linespacing=self.get_linespacing(),
+                    transform=IdentityTransform())
+        text.set_figure(self.figure)
+
+        bbox = text.get_window_extent(renderer)
+        x0 = floor(bbox.x0) - self.PAD
+        y0 = floor(bbox.y0) - self.PAD
+        width = ceil(bbox.x1) + self.PAD - x0
+        height = ceil(bbox.y1) + self.PAD - y0
+
+        offscreen = RendererAgg(width, height, renderer.dpi)
+        text.set_position((-x0, -y0))
+        text.draw(offscreen)
+        # The buffer starts with the top row but draw_image() expects
+        # the bottom row first.
+        image = asarray(offscreen.buffer_rgba())[::-1].copy()
+        return image, x0, y0
+
+    @allow_rasterization
+    def draw(self, renderer):
+
+        if not isinstance(renderer, RendererAgg):
+            super().draw(renderer)
+            return
+
+        self._renderer = renderer
+        if not self.get_visible() or self.get_text() == '':
+            return
+
+        x, y = self.get_transform().transform(self.get_position())
+        if not self.axes.contains_point((x, y)):
+            return
+
+        key = self._image_key(renderer)
+        entry = self.images.get(key)
+        if entry is None:
+            entry = self._render_image(renderer)
+            self.images.add(key, entry)
+        image, x0, y0 = entry
+
+        gc = renderer.new_gc()
+        renderer.draw_image(gc, round(x) + x0, round(y) + y0, image)
+        gc.restore()
+        self.stale = False
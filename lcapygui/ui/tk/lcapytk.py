@@ -7,6 +7,7 @@ from os.path import basename
 from ..uimodeldnd import UIModelDnD
 from .sketcher import Sketcher
 from .drawing import Drawing
+from .motion_coalescer import MotionCoalescer
 from .menu import MenuBar, MenuDropdown, MenuItem, MenuSeparator
 from ...sketch_library import SketchLibrary
 from .previewer import Previewer
@@ -24,7 +25,7 @@ class LcapyTk(Tk):
     NAME = 'lcapy-tk'
 
     def __init__(self, pathnames=None, debug=0, level=0, devel=False,
-                 icon=None, title="lcapy-gui"):
+                 icon=None, title="lcapy-gui", warmup=True):
 
         from ... import __version__
 
@@ -37,6 +38,12 @@ class LcapyTk(Tk):
         self.canvas = None
         self.sketchlib = SketchLibrary()
         self.dialogs = {}
+        # Mouse motion is handled when Tk is idle, for the latest event
+        self.motion = MotionCoalescer(self, self.on_mouse_motion)
+
+        # The sketches are loaded in the background when the first
+        # model is created; see new().
+        self.warmup = warmup
 
         # Icons and Theming
 
@@ -306,6 +313,7 @@ class LcapyTk(Tk):
     def display(self):
 
         self.mainloop()
+        self.sketchlib.shutdown()
 
     def enter(self, canvas):
 
@@ -402,11 +410,24 @@ class LcapyTk(Tk):
     def new(self, name='untitled.sch'):
 
         model = self.uimodel_class(self)
+        if self.warmup:
+            self.warmup = False
+            self.warmup_sketches(model.preferences.style)
         model.pathname = name
         canvas = self.create_canvas(name, model)
         self.model = model
         return model
 
+    def warmup_sketches(self, style):
+
+        # Load the sketches in the background so that placing or
+        # loading components does not stall on sketch parsing.  All
+        # the styles are loaded, starting with the current style, so
+        # that the style can be switched without delay.
+        styles = [style] + [style1 for style1 in SketchLibrary.styles
+                            if style1 != style]
+        self.sketchlib.warmup(styles)
+
     def on_ac_model(self, *args):
         self.model.on_ac_model()
 
@@ -443,6 +464,8 @@ class LcapyTk(Tk):
             '/tmp/cg.png', title='Circuit graph ' + self.model.pathname)
 
     def on_click_event(self, event):
+        self.motion.flush()
+        self.model.on_interaction_start()
         if event.xdata is None or event.ydata is None:
             # Can this happen?
             return
@@ -464,8 +487,10 @@ class LcapyTk(Tk):
 
     def on_release_event(self, event):
 
+        self.motion.flush()
         if event.button == 1:
             self.model.on_mouse_release(event.key)
+        self.model.on_interaction_end()
 
     def on_clone(self, *args):
         self.model.on_clone()
@@ -494,6 +519,7 @@ class LcapyTk(Tk):
 
     def on_default_fit(self, *args):
         self.canvas.drawing.set_default_view()
+        self.model.redraw_visible()
         self.refresh()
 
     def on_delete(self, *args):
@@ -581,6 +607,7 @@ class LcapyTk(Tk):
         self.model.on_inspect_voltage()
 
     def on_key_press_event(self, event):
+        self.motion.flush()
         key = event.key
         if self.debug:
             print(key)
@@ -631,7 +658,13 @@ class LcapyTk(Tk):
 
     def on_mouse_event(self, event):
 
+        self.motion.push(event)
+
+    def on_mouse_motion(self, event):
+
         if self.debug:
+            print('Motion events: received %d, processed %d' %
+                  (self.motion.received, self.motion.processed))
             if event.xdata is None or event.ydata is None:
                 print('Mouse event: x=%d, y=%d, button=%d' %
                       (event.x, event.y, event.button))
@@ -730,7 +763,17 @@ class LcapyTk(Tk):
     def refresh(self):
         self.canvas.drawing.refresh()
 
+    def refresh_overlay(self):
+        self.canvas.drawing.refresh_overlay()
+
+    def invalidate_background(self):
+        self.canvas.drawing.invalidate_background()
+
+    def add_overlay(self, artists):
+        self.canvas.drawing.add_overlay(artists)
+
     def quit(self):
+        self.sketchlib.shutdown()
         exit()
 
     def save(self, pathname):
@@ -743,6 +786,9 @@ class LcapyTk(Tk):
     def set_canvas_title(self, name):
         self.notebook.tab('current', text=name)
 
+    def get_view(self):
+        return self.canvas.drawing.get_view()
+
     def set_view(self, xmin, ymin, xmax, ymax):
         self.canvas.drawing.set_view(xmin, ymin, xmax, ymax)
 
@@ -0,0 +1,49 @@
+class MotionCoalescer:
+    """Coalesces mouse motion events so that a slow handler only sees
+    the latest position.  Each event replaces the pending event and
+    the handler is run once when Tk is next idle; the intermediate
+    events are dropped.  This stops the cursor lagging behind the
+    mouse when the handler cannot keep up."""
+
+    def __init__(self, widget, handler):
+
+        self.widget = widget
+        self.handler = handler
+        self.pending = None
+        self.after_id = None
+        # Number of events received and number passed to the handler
+        self.received = 0
+        self.processed = 0
+
+    @property
+    def dropped(self):
+
+        return self.received - self.processed - (self.pending is not None)
+
+    def push(self, event):
+
+        self.received += 1
+        self.pending = event
+        if self.after_id is None:
+            self.after_id = self.widget.after_idle(self.on_idle)
+
+    def on_idle(self):
+
+        self.after_id = None
+        self.flush()
+
+    def flush(self):
+        """Run the handler for the pending event, if any.  This is
+        called before handling button and key events so that they
+        are handled after the final motion."""
+
+        if self.after_id is not None:
+            self.widget.after_cancel(self.after_id)
+            self.after_id = None
+
+        event = self.pending
+        if event is None:
+            return
+        self.pending = None
+        self.processed += 1
+        self.handler(event)
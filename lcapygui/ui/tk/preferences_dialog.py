@@ -68,6 +68,10 @@ class PreferencesDialog(Window):
                               self.model.preferences.snap_grid,
                               ('true', 'false'),
                               command=self.on_update),
+                   LabelEntry('hide_labels', 'Hide labels when moving',
+                              self.model.preferences.hide_labels,
+                              ('true', 'false'),
+                              command=self.on_update),
                    LabelEntry('line_width_scale', 'Line width scale',
                               self.model.preferences.line_width_scale,
                               command=self.on_update),
@@ -113,6 +117,8 @@ class PreferencesDialog(Window):
         self.model.preferences.xsize = self.labelentries.get('xsize')
         self.model.preferences.ysize = self.labelentries.get('ysize')
         self.model.preferences.snap_grid = self.labelentries.get('snap_grid')
+        self.model.preferences.hide_labels = self.labelentries.get(
+            'hide_labels')
         self.model.preferences.current_sign_convention = self.labelentries.get(
             'current_sign_convention')
         self.model.preferences.line_width_scale = self.labelentries.get(
@@ -1,7 +1,13 @@
 from matplotlib.patches import PathPatch, Arc, Circle, Polygon
+from matplotlib.lines import Line2D
 from matplotlib.path import Path
+from matplotlib.text import Text
+from matplotlib.transforms import Affine2D
+from itertools import chain
 from math import degrees
 from numpy import array
+from .label_text import LabelText, TextImages
+from .batch import LineBatch, MarkerBatch, BatchItem, SegmentItem, MarkerItem
 
 
 class Sketcher:
@@ -10,6 +16,10 @@ class Sketcher:
 
         self.ax = ax
         self.debug = debug
+        # Collections of segments and node markers indexed by kind
+        self.batches = {}
+        # Rendered text images shared by the labels
+        self.text_images = TextImages()
 
     def clear(self):
 
@@ -23,31 +33,33 @@ class Sketcher:
         else:
             self.ax.remove(patch)
 
-    def sketch(self, sketch, tf, **kwargs):
+    def _sketch_paths(self, sketch, tf, mirror=False, invert=False):
+        """Return list of (path, fill) tuples for the transformed sketch
+        paths."""
 
-        color = kwargs.pop('color', sketch.color)
-        mirror = kwargs.pop('mirror', False)
-        invert = kwargs.pop('invert', False)
+        # Draw each path separately in debug mode so they can be
+        # distinguished.
+        paths = sketch.oriented_paths(0, 1, mirror, invert,
+                                      compound=not self.debug)
+        if tf is None:
+            return paths
 
-        patches = []
+        return [(path.transformed(tf), fill) for path, fill in paths]
+
+    def _offset_transform(self, offset):
 
-        for m, spath in enumerate(sketch.paths):
-            path = spath.path
-            fill = spath.fill
+        return Affine2D().translate(*offset) + self.ax.transData
 
-            # Note, the SVG coordinate system has y going down the screen
-            # but Matplotlib's coordinate system has y going up the screen.
-            # Thus we need to invert the sense of mirror.
+    def _add_sketch_patches(self, sketch, paths, transform=None, **kwargs):
 
-            if not mirror:
-                vertices = path.vertices * (1, -1)
-                path = Path(vertices, path.codes)
-            if invert:
-                vertices = path.vertices * (-1, 1)
-                path = Path(vertices, path.codes)
+        color = kwargs.pop('color', sketch.color)
+
+        if transform is not None:
+            kwargs['transform'] = transform
+
+        patches = []
 
-            if tf is not None:
-                path = path.transformed(tf)
+        for m, (path, fill) in enumerate(paths):
 
             fill = kwargs.pop('fill', fill)
 
@@ -61,11 +73,167 @@ class Sketcher:
 
         return patches
 
+    def sketch(self, sketch, tf, **kwargs):
+
+        mirror = kwargs.pop('mirror', False)
+        invert = kwargs.pop('invert', False)
+
+        paths = self._sketch_paths(sketch, tf, mirror, invert)
+        return self._add_sketch_patches(sketch, paths, **kwargs)
+
+    def place_sketch(self, sketch, offset, angle=0, scale=1, **kwargs):
+        """Draw `sketch` rotated by `angle` degrees, scaled by `scale`,
+        and translated by `offset`.  The rotated and scaled paths are
+        shared between components with the same orientation and the
+        translation is applied by the patch transform so the patches
+        can be moved with `move_patches()`."""
+
+        mirror = kwargs.pop('mirror', False)
+        invert = kwargs.pop('invert', False)
+
+        paths = sketch.oriented_paths(angle, scale, mirror, invert,
+                                      compound=not self.debug)
+        return self._add_sketch_patches(sketch, paths,
+                                        self._offset_transform(offset),
+                                        **kwargs)
+
+    def move_patches(self, patches, offset):
+        """Move patches created by `place_sketch()` to `offset`."""
+
+        transform = self._offset_transform(offset)
+        for patch in patches:
+            patch.set_transform(transform)
+
+    def resketch(self, patches, sketch, offset, angle=0, scale=1,
+                 mirror=False, invert=False):
+        """Change the paths of the patches created by `place_sketch()`
+        to those of another sketch.  The list of patches is modified in
+        place, reusing the existing patches where possible.  This
+        returns False if the patches cannot be updated and need to be
+        redrawn."""
+
+        paths = sketch.oriented_paths(angle, scale, mirror, invert,
+                                      compound=not self.debug)
+        if patches == [] and paths != []:
+            return False
+
+        for patch in patches[len(paths):]:
+            patch.remove()
+        del patches[len(paths):]
+
+        transform = self._offset_transform(offset)
+        for m, (path, fill) in enumerate(paths):
+            if m < len(patches):
+                patch = patches[m]
+                patch.set_path(path)
+            else:
+                patch = PathPatch(path)
+                patch.update_from(patches[0])
+                self.ax.add_patch(patch)
+                patches.append(patch)
+            patch.set_fill(fill)
+            patch.set_transform(transform)
+
+        return True
+
+    def translate(self, artists, dx, dy):
+        """Move lines, text, and circles by `dx` and `dy`.  This returns
+        False, without moving anything, if any of the artists are of
+        another kind."""
+
+        if not all(isinstance(artist, (Line2D, Text, Circle, BatchItem))
+                   for artist in artists):
+            return False
+
+        for artist in artists:
+            if isinstance(artist, BatchItem):
+                artist.translate(dx, dy)
+            elif isinstance(artist, Line2D):
+                xdata, ydata = artist.get_data()
+                artist.set_data(array(xdata) + dx, array(ydata) + dy)
+            elif isinstance(artist, Text):
+                x, y = artist.get_position()
+                artist.set_position((x + dx, y + dy))
+            else:
+                x, y = artist.center
+                artist.set_center((x + dx, y + dy))
+        return True
+
+    def rescale(self, scale):
+        """Multiply the font sizes and line widths of the drawn artists
+        by `scale`.  This is much quicker than redrawing them when the
+        view is zoomed.  Overlay artists are not changed since they are
+        redrawn as the mouse moves, and node markers keep their line
+        width."""
+
+        for text in self.ax.texts:
+            if not text.get_animated():
+                text.set_fontsize(text.get_fontsize() * scale)
+
+        for artist in chain(self.ax.lines, self.ax.patches):
+            if not artist.get_animated():
+                artist.set_linewidth(artist.get_linewidth() * scale)
+
+        batch = self.batches.get('segments')
+        if batch is not None and batch.axes is self.ax:
+            batch.scale_items('lw', scale)
+
     def stroke_line(self, xstart, ystart, xend, yend, color='black', **kwargs):
 
         return self.ax.plot((xstart, xend), (ystart, yend),
                             color=color, **kwargs)
 
+    def _batch(self, kind):
+
+        batch = self.batches.get(kind)
+        # The batches are discarded when the axes are cleared.
+        if batch is None or batch.axes is not self.ax:
+            if kind == 'segments':
+                batch = LineBatch()
+            elif kind == 'dots':
+                batch = MarkerBatch()
+            elif kind == 'donuts':
+                # These are drawn over wires.
+                batch = MarkerBatch(zorder=10)
+            else:
+                raise ValueError('Unknown batch ' + kind)
+            self.ax.add_collection(batch, autolim=False)
+            self.batches[kind] = batch
+        return batch
+
+    def stroke_segment(self, xstart, ystart, xend, yend, color='black',
+                       lw=1.5, linestyle='solid', **kwargs):
+        """This is like `stroke_line()` but the segment is added to a
+        collection shared with the other segments rather than being
+        a separate artist.  This returns an object that can be moved
+        and removed like a line."""
+
+        if kwargs:
+            # Fall back to a line for unusual styles.
+            line, = self.stroke_line(xstart, ystart, xend, yend,
+                                     color=color, lw=lw,
+                                     linestyle=linestyle, **kwargs)
+            return line
+
+        batch = self._batch('segments')
+        index = batch.add_segment(xstart, ystart, xend, yend, color, lw,
+                                  linestyle)
+        return SegmentItem(batch, index)
+
+    def stroke_node(self, x, y, radius=0.5, color='black', port=False):
+        """Draw a node marker; this is a filled circle or, for a port,
+        an open circle.  The markers are added to a collection shared
+        with the other markers of the same kind.  This returns an object
+        that can be moved and removed like a patch."""
+
+        if port:
+            batch = self._batch('donuts')
+            index = batch.add_marker(x, y, radius, fc='white', ec='black')
+        else:
+            batch = self._batch('dots')
+            index = batch.add_marker(x, y, radius, fc=color)
+        return MarkerItem(batch, index, (x, y), radius)
+
     def stroke_arc(self, x, y, r, theta1, theta2, **kwargs):
 
         r *= 2
@@ -146,4 +314,7 @@ class Sketcher:
         # dollar signs inside mathrm, e.g., \mathrm{$A_2$}
         # text = r'$\mathrm{' + latex_format_label(text) + '}$'
 
-        return self.ax.annotate(text, (x, y), ha=ha, va=va, **kwargs)
+        label = LabelText(x, y, text, self.text_images, ha=ha, va=va,
+                          **kwargs)
+        self.ax.add_artist(label)
+        return label
@@ -8,6 +8,8 @@ from .history import History
 from .action import ActionAdd, ActionDelete, ActionMove
 from .actions import Actions
 from .labelmaker import LabelMaker
+from ..core.grid_index import GridIndex
+from ..core.cpt_table import CptTable
 from warnings import warn
 
 from copy import copy
@@ -54,6 +56,24 @@ class UIModelBase:
 
     SCALE = 0.25
 
+    # Components are drawn if they are within the view enlarged by
+    # this fraction of its size on each side.
+    CULL_MARGIN = 0.25
+
+    # Components are drawn as outlines, without labels and node dots,
+    # when zoomed out beyond this.  A component is then about fifteen
+    # pixels in size.
+    OUTLINE_ZOOM = 0.1
+
+    # Nodes closer than this to a position are considered to be at
+    # that position.
+    NODE_RADIUS = 0.1 ** 0.5
+
+    # Components with extents closer than this to a position are
+    # candidates for being at that position.  A connection is within
+    # this distance of its midpoint.
+    CPT_MARGIN = 0.5
+
     # Short-cut key, menu name, cpt type, kind
     component_map = {
         'y': Thing('y', 'Admittance', 'Y', ''),
@@ -130,6 +150,32 @@ class UIModelBase:
         self.mouse_position = (0, 0)
         self.dragged = False
         self.zoom_factor = 1
+        # Level of detail for drawing components: 'full' or 'outline'
+        self.lod = 'full'
+        # Components and nodes that need to be redrawn; these are
+        # dicts used as ordered sets.
+        self.dirty_cpts = {}
+        self.dirty_nodes = {}
+        # Spatial index of the component extents
+        self.cpt_index = GridIndex()
+        # Geometry of the components for hit-testing many components
+        # at once; this is kept in step with the spatial index.
+        self.cpt_table = CptTable()
+        # Spatial index of the node positions; this is made when
+        # needed and discarded when the network changes.
+        self.node_index = None
+        # Spatial index of the component pins keyed by (gcpt, pin name)
+        self.pin_index = GridIndex(cell_size=1)
+        # Component and pin index keys for each indexed gcpt
+        self.pin_keys = {}
+        # Components that have moved since they were indexed; this
+        # is a dict used as an ordered set.
+        self.stale_cpts = {}
+        # Components not drawn since they are outside the view; this
+        # is a dict used as an ordered set.
+        self.culled = {}
+        # True if the labels are hidden while dragging or panning
+        self.labels_hidden = False
 
     @property
     def node_spacing(self):
@@ -195,7 +241,11 @@ class UIModelBase:
             new_cpt.gcpt = cpt.gcpt
             new_cpt.gcpt.nodes = cpt.gcpt.nodes
 
-            self.cpt_draw(new_cpt)
+            # Redraw the neighbours too since their node markers
+            # may change.
+            self.mark_dirty(new_cpt)
+            for node in new_cpt.nodes:
+                self.mark_dirty(node)
             self.select(new_cpt)
 
         elif code == 'D':
@@ -214,6 +264,7 @@ class UIModelBase:
                 new_name, new_pos = new_node_info
 
                 old_node = nodes[old_name]
+                self.mark_dirty(old_node)
 
                 if old_name == new_name:
                     if self.ui.debug:
@@ -236,6 +287,7 @@ class UIModelBase:
                         # This creates a new node if it does not exist.
                         node = nodes.add(new_name, cpt, self.circuit)
                         node.pos = Pos2(new_pos[0], new_pos[1])
+                        self.mark_dirty(node)
 
                         for m, node1 in enumerate(cpt.nodes):
                             if node1.name == old_name:
@@ -249,7 +301,6 @@ class UIModelBase:
             # Generalise if have multiple cpts or nodes selected.
             thing = event.cpt[0]
             self.select(thing)
-            self.on_redraw()
 
         else:
             raise ValueError('Unhandled event', code)
@@ -306,20 +357,12 @@ class UIModelBase:
         if type(ignore) == Node:
             ignore = [ignore]
 
-        for node in self.circuit.nodes.values():
-            if node.pos is None:
-                # This happens with opamps.  Node 0 is the default
-                # reference pin.
-                warn('Ignoring node %s with no position' % node.name)
-                continue
-            elif ignore is not None and node in ignore:
+        for node in self.nodes_near(x, y):
+            if ignore is not None and node in ignore:
                 if self.ui.debug:
                     print('Ignoring node %s' % node.name)
                 continue
-            x1, y1 = node.pos.x, node.pos.y
-            rsq = (x1 - x) ** 2 + (y1 - y) ** 2
-            if rsq < 0.1:
-                return node
+            return node
         return None
 
     def closest_pin(self, x, y):
@@ -334,17 +377,20 @@ class UIModelBase:
             y position
         """
 
-        for cpt in self.circuit.elements.values():
-            gcpt = cpt.gcpt
-            if gcpt is None:
-                continue
+        self.cpt_index_sync()
 
-            for pin in gcpt.transformed_pins:
-                x1, y1 = pin.pos.x, pin.pos.y
-                rsq = (x1 - x) ** 2 + (y1 - y) ** 2
-                if rsq < 0.1:
-                    return cpt, pin
-        return None, None
+        r = self.NODE_RADIUS
+        closest = None, None
+        rmin = r ** 2
+        for gcpt, pinname in self.pin_index.query((x - r, y - r,
+                                                    x + r, y + r)):
+            pin = gcpt.transformed_pins[pinname]
+            x1, y1 = pin.pos.x, pin.pos.y
+            rsq = (x1 - x) ** 2 + (y1 - y) ** 2
+            if rsq < rmin:
+                closest = self.pin_keys[gcpt][0], pin
+                rmin = rsq
+        return closest
 
     def copy(self, cpt):
 
@@ -391,13 +437,24 @@ class UIModelBase:
 
         self.select(None)
 
+        # This may be passed the gcpt rather than the cpt.
+        gcpt = getattr(cpt, 'gcpt', cpt)
+
         redraw = True
         try:
-            cpt.undraw()
+            gcpt.undraw()
             redraw = False
         except AttributeError:
             pass
 
+        # The neighbours may need their node markers redrawn.
+        for node in cpt.nodes:
+            self.mark_dirty(node)
+
+        cpt = self.circuit.elements.get(cpt.name, cpt)
+        self.cpt_index_remove(cpt)
+        self.culled.pop(cpt, None)
+
         self.circuit.remove(cpt.name)
         self.invalidate()
 
@@ -415,7 +472,18 @@ class UIModelBase:
         if 'color' not in kwargs:
             kwargs['color'] = self.preferences.color('line')
 
-        gcpt.draw(self, **kwargs)
+        self.cpt_index_update(cpt)
+        self.culled.pop(cpt, None)
+
+        # The component is drawn afresh; either it has been undrawn or
+        # the axes have been cleared and its old artists are gone.
+        gcpt.annotations = []
+        gcpt.node_markers = []
+
+        self.gcpt_draw(gcpt, **kwargs)
+        if self.lod == 'outline':
+            # The labels and node dots would be too small to see.
+            return
 
         label_style = self.preferences.label_style
 
@@ -514,7 +582,9 @@ class UIModelBase:
                 dnodes.append(node)
 
             for node in dnodes:
-                self.node_draw(node)
+                marker = self.node_draw(node)
+                if marker is not None:
+                    gcpt.node_markers.append(marker)
 
         label_nodes = self.preferences.label_nodes
         if label_nodes != 'none':
@@ -539,6 +609,19 @@ class UIModelBase:
                          self.zoom_factor)
                 gcpt.annotations.append(ann)
 
+        if self.labels_hidden:
+            for ann in gcpt.annotations:
+                ann.set_visible(False)
+
+    def gcpt_draw(self, gcpt, **kwargs):
+        """Draw a component without its labels and node markers at the
+        current level of detail."""
+
+        if self.lod == 'outline':
+            gcpt.draw_outline(self, **kwargs)
+        else:
+            gcpt.draw(self, **kwargs)
+
     def cpt_find(self, node_name1, node_name2):
 
         fcpt = None
@@ -567,8 +650,7 @@ class UIModelBase:
             # or if we wish to move all the components sharing the
             # a node with the selected component, we can just move the nodes
 
-            for node in cpt.nodes:
-                self.node_move(node, node.pos.x + xshift, node.pos.y + yshift)
+            self.nodes_shift(cpt.nodes, xshift, yshift)
 
         else:
             # Alternatively, we need to detach the component and
@@ -600,15 +682,63 @@ class UIModelBase:
         # New position of nodes
         node.pos.x = new_x
         node.pos.y = new_y
+        self.node_index_update(node)
 
         if self.ui.debug:
             print('Moving node', node.name, 'to', node.pos)
 
-        # Update connected components
+        # Update connected components; their labels and node markers
+        # are redrawn by redraw_dirty.
         for cpt in node.connected:
+            if cpt in self.culled:
+                continue
             gcpt = cpt.gcpt
             gcpt.undraw()
-            gcpt.draw(self, color=self.preferences.color('line'))
+            self.gcpt_draw(gcpt, color=self.preferences.color('line'))
+        self.mark_dirty(node)
+
+    def nodes_shift(self, nodes, xshift, yshift):
+        """
+        Shifts the positions of the given nodes.  The connected components
+        that have all their nodes shifted are moved without redrawing;
+        the other connected components are redrawn
+
+        Parameters
+        ==========
+        nodes : list[lcapy.nodes.Node]
+            The nodes to move
+        xshift : float
+            The x shift
+        yshift : float
+            The y shift
+        """
+
+        nodes = list(dict.fromkeys(nodes))
+
+        cpts = {}
+        for node in nodes:
+            node.pos.x += xshift
+            node.pos.y += yshift
+            self.node_index_update(node)
+            self.mark_dirty(node)
+            for cpt in node.connected:
+                cpts[cpt] = True
+
+        if self.ui.debug:
+            print('Shifting nodes', ', '.join(node.name for node in nodes),
+                  'by', xshift, yshift)
+
+        # Update connected components; the moved components are redrawn
+        # with their labels by redraw_dirty.
+        for cpt in cpts:
+            if cpt in self.culled:
+                continue
+            gcpt = cpt.gcpt
+            if (all(node in nodes for node in cpt.nodes) and
+                    gcpt.translate(self, xshift, yshift)):
+                continue
+            gcpt.undraw()
+            self.gcpt_draw(gcpt, color=self.preferences.color('line'))
 
     def node_join(self, from_node, to_node=None):
         """
@@ -792,6 +922,8 @@ class UIModelBase:
     def invalidate(self):
 
         self._analysis_circuit = None
+        # The nodes may have been added, removed, or renamed.
+        self.node_index = None
 
     def load(self, pathname):
 
@@ -891,22 +1023,79 @@ class UIModelBase:
             y position
         """
 
-        nodes = []
+        return [node for node in self.nodes_near(x, y)
+                if node is not ignore]
 
-        for node in self.circuit.nodes.values():
-            if node is ignore:
+    def nodes_near(self, x, y):
+        """Return list of the nodes close to the specified position
+        found with the spatial index of the nodes."""
+
+        if self.node_index is None:
+            self.node_index_make()
+
+        r = self.NODE_RADIUS
+        nodes = []
+        for node in self.node_index.query((x - r, y - r, x + r, y + r)):
+            # Skip nodes that have been removed or have moved away
+            # without the index being updated.
+            if self.circuit.nodes.get(node.name) is not node:
                 continue
             if node.pos is None:
-                # This happens with opamps.  Node 0 is the default
-                # reference pin.
-                warn('Ignoring node %s with no position' % node.name)
                 continue
             x1, y1 = node.pos.x, node.pos.y
             rsq = (x1 - x) ** 2 + (y1 - y) ** 2
-            if rsq < 0.1:
+            if rsq < r ** 2:
                 nodes.append(node)
         return nodes
 
+    def cpts_near(self, x, y, r=None):
+        """Return list of the components with extents within `r` of
+        the specified position found with the spatial index of the
+        components."""
+
+        self.cpt_index_sync()
+
+        if r is None:
+            r = self.CPT_MARGIN
+        return [cpt for cpt in self.cpt_index.query((x - r, y - r,
+                                                      x + r, y + r))
+                if self.circuit.elements.get(cpt.name) is cpt]
+
+    def cpts_within(self, bbox):
+        """Return list of the components with extents inside the
+        bounding box `bbox` (xmin, ymin, xmax, ymax), say for a
+        rubber-band selection."""
+
+        self.cpt_index_sync()
+
+        return [cpt for cpt in self.cpt_table.within(bbox)
+                if self.circuit.elements.get(cpt.name) is cpt]
+
+    def node_index_make(self):
+
+        self.node_index = GridIndex(cell_size=1)
+        for node in self.circuit.nodes.values():
+            if node.pos is None:
+                # This happens with opamps.  Node 0 is the default
+                # reference pin.
+                warn('Ignoring node %s with no position' % node.name)
+                continue
+            self.node_index_update(node)
+
+    def node_index_update(self, node):
+        """Update the position of `node` in the spatial index of the
+        nodes.  This needs to be called when a node is moved."""
+
+        if self.node_index is None:
+            return
+
+        if node.pos is None:
+            self.node_index.remove(node)
+            return
+
+        x, y = node.pos.x, node.pos.y
+        self.node_index.insert(node, (x, y, x, y))
+
     def paste(self, x1, y1, x2, y2):
 
         self.history.add('Paste', self.clipboard)
@@ -1027,20 +1216,23 @@ class UIModelBase:
 
     def pinname_find(self, position):
 
-        for cpt in self.circuit.elements.values():
-            gcpt = cpt.gcpt
-            if gcpt is None:
+        self.cpt_index_sync()
+
+        x, y = position
+        eps = 1e-5
+        for gcpt, pinname in self.pin_index.query((x - eps, y - eps,
+                                                    x + eps, y + eps)):
+            pin = gcpt.transformed_pins[pinname]
+            if abs(pin.x - x) >= eps or abs(pin.y - y) >= eps:
                 continue
-            pin = gcpt.transformed_pins.by_position(position)
-
-            if pin is not None:
-                if pin.isnode:
-                    # FIXME, there must be a better way
-                    node = self.circuit.nodes.by_position(position)
-                    if node is None:
-                        raise ValueError('Node problem', gcpt)
-                    return node.name
-                return gcpt.name + '.' + pin.name
+
+            if pin.isnode:
+                # FIXME, there must be a better way
+                for node in self.nodes_near(x, y):
+                    if abs(node.x - x) < eps and abs(node.y - y) < eps:
+                        return node.name
+                raise ValueError('Node problem', gcpt)
+            return gcpt.name + '.' + pin.name
         return None
 
     def thing_create(self, cpt_type, x1, y1, x2, y2, kind='', join=True):
@@ -1089,8 +1281,12 @@ class UIModelBase:
         if self.ui.debug:
             print('Adding ' + netitem)
 
+        # Adding a component only adds nodes so the node index is
+        # kept rather than being remade when next needed.
+        node_index = self.node_index
         cpt = self.circuit.add(netitem)
         self.invalidate()
+        self.node_index = node_index
 
         if not isinstance(cpt, Cpt):
             # Support older versions of Lcapy
@@ -1098,13 +1294,14 @@ class UIModelBase:
 
         for m, position in enumerate(positions):
             cpt.nodes[m].pos = Pos(position)
+            self.node_index_update(cpt.nodes[m])
 
         attr_string = netitem.split(';', 1)[1]
         gcpt.update(nodes=cpt.nodes, opts=Opts(attr_string))
 
         cpt.gcpt = gcpt
 
-        self.check_drawable_nodes()
+        self.check_drawable_nodes([cpt])
 
         self.cpt_draw(cpt)
 
@@ -1112,7 +1309,14 @@ class UIModelBase:
 
         return cpt
 
-    def check_drawable_nodes(self):
+    def check_drawable_nodes(self, cpts=None):
+        """Set the is_drawn and is_implicit attributes of the nodes.
+        If `cpts` is specified, only the nodes of these components are
+        updated; this is sufficient after the components are added."""
+
+        if cpts is not None:
+            self.check_drawable_cpt_nodes(cpts)
+            return
 
         # FIXME, this is unnecessarily complicated due to Lcapy and
         # Lcapy-gui components both having nodes.
@@ -1146,6 +1350,40 @@ class UIModelBase:
                 node.is_drawn = nodes[node.name].is_drawn
                 node.is_implicit = nodes[node.name].is_implicit
 
+    def check_drawable_cpt_nodes(self, cpts):
+        """Set the is_drawn and is_implicit attributes of the nodes of
+        `cpts`.  These only depend on the components connected to each
+        node so the rest of the circuit is not looked at."""
+
+        nodes = self.circuit.nodes
+
+        names = {}
+        for cpt in cpts:
+            for node in cpt.gcpt.nodes:
+                names[node.name] = True
+
+        for name in names:
+            node = nodes[name]
+            connected = [cpt.gcpt for cpt in node.connected
+                         if hasattr(cpt, 'gcpt')]
+
+            node.is_drawn = True
+            node.is_implicit = False
+            for gcpt in connected:
+                drawn_nodes = set(gcpt.drawn_nodes)
+                for node1 in gcpt.nodes:
+                    if node1.name == name and node1 not in drawn_nodes:
+                        node.is_drawn = False
+                for node1 in gcpt.implicit_nodes:
+                    if node1.name == name:
+                        node1.is_implicit = True
+
+            for gcpt in connected:
+                for node1 in gcpt.nodes:
+                    if node1.name == name:
+                        node1.is_drawn = node.is_drawn
+                        node1.is_implicit = node.is_implicit
+
     def inspect_admittance(self, cpt):
 
         try:
@@ -1244,6 +1482,12 @@ class UIModelBase:
         if self.ui.debug:
             print('Selected', thing)
 
+        # The old and new selected components change colour.
+        if thing is not self.selected:
+            for cpt in (self.selected, thing):
+                if isinstance(cpt, Cpt):
+                    self.mark_dirty(cpt)
+
         self.selected = thing
 
     def is_close_to(self, x, xc):
@@ -1343,21 +1587,13 @@ class UIModelBase:
             print('Pos unknown for ' + str(node))
             return
 
-        if node.port:
-            self.ui.sketcher.stroke_donut(
-                node.x, node.y, self.preferences.node_size,
-                color=self.preferences.node_color, alpha=1)
-        else:
-            self.ui.sketcher.stroke_filled_circle(
-                node.x, node.y, self.preferences.node_size,
-                color=self.preferences.node_color, alpha=1)
+        return self.ui.sketcher.stroke_node(
+            node.x, node.y, self.preferences.node_size,
+            color=self.preferences.node_color, port=node.port)
 
     def node_find(self, nodename):
 
-        for node in self.circuit.nodes.values():
-            if node.name == nodename:
-                return node
-        return None
+        return self.circuit.nodes.get(nodename)
 
     def redo(self):
 
@@ -1372,16 +1608,275 @@ class UIModelBase:
             print('Redo ' + event.code)
         self.apply_event(event, False)
 
+    def lod_for_zoom(self, zoom_factor):
+        """Return the level of detail for drawing components at the
+        specified zoom factor."""
+
+        if zoom_factor < self.OUTLINE_ZOOM:
+            return 'outline'
+        return 'full'
+
+    def mark_dirty(self, thing):
+        """Mark a component or a node as needing to be redrawn by
+        `redraw_dirty`.  For a node, the components connected to it
+        are redrawn."""
+
+        if thing is None:
+            return
+
+        if isinstance(thing, Node):
+            self.dirty_nodes[thing] = True
+        else:
+            self.dirty_cpts[thing] = True
+
+    def cpt_index_update(self, cpt):
+
+        try:
+            extent = cpt.gcpt.extent
+        except AttributeError:
+            extent = None
+
+        if extent is None:
+            self.cpt_index.remove(cpt)
+            self.cpt_table.remove(cpt)
+        else:
+            self.cpt_index.insert(cpt, extent)
+
+        self.pin_index_add(cpt)
+
+    def cpt_index_remove(self, cpt):
+
+        self.cpt_index.remove(cpt)
+        self.cpt_table.remove(cpt)
+        self.pin_index_remove(cpt)
+
+    def pin_index_add(self, cpt):
+        """Add the pins of a component to the pin index.  The pins are
+        indexed when next needed.  The pins and the extent of the
+        component are reindexed whenever the component transform
+        changes."""
+
+        gcpt = getattr(cpt, 'gcpt', None)
+        if gcpt is None:
+            return
+
+        entry = self.pin_keys.get(gcpt)
+        keys = [] if entry is None else entry[1]
+        self.pin_keys[gcpt] = cpt, keys
+        gcpt.on_transform_change = self.cpt_index_stale
+        self.stale_cpts[gcpt] = True
+
+    def pin_index_remove(self, cpt):
+
+        gcpt = getattr(cpt, 'gcpt', None)
+        entry = self.pin_keys.get(gcpt)
+        # A remade component shares the gcpt of the old component.
+        if entry is None or entry[0] is not cpt:
+            return
+        del self.pin_keys[gcpt]
+
+        for key in entry[1]:
+            self.pin_index.remove(key)
+        self.stale_cpts.pop(gcpt, None)
+        gcpt.on_transform_change = None
+
+    def cpt_index_stale(self, gcpt):
+
+        if gcpt in self.pin_keys:
+            self.stale_cpts[gcpt] = True
+
+    def cpt_index_sync(self):
+        """Index the extents and the pins of the components that have
+        been added or moved and update their rows of the component
+        table."""
+
+        for gcpt in self.stale_cpts:
+            cpt, keys = self.pin_keys[gcpt]
+            extent = gcpt.extent
+            if extent is None:
+                self.cpt_index.remove(cpt)
+            else:
+                self.cpt_index.insert(cpt, extent)
+            self.cpt_table.insert(cpt, gcpt)
+
+            for key in keys:
+                self.pin_index.remove(key)
+
+            keys = []
+            for pin in gcpt.transformed_pins:
+                key = gcpt, pin.name
+                self.pin_index.insert(key, (pin.x, pin.y, pin.x, pin.y))
+                keys.append(key)
+            self.pin_keys[gcpt] = cpt, keys
+
+        self.stale_cpts = {}
+
+    def view_bbox(self):
+        """Return the bounding box (xmin, ymin, xmax, ymax) of the
+        region in which components are drawn or None if everything is
+        to be drawn."""
+
+        view = self.ui.get_view()
+        if view is None:
+            return None
+
+        xmin, ymin, xmax, ymax = view
+        dx = (xmax - xmin) * self.CULL_MARGIN
+        dy = (ymax - ymin) * self.CULL_MARGIN
+        return xmin - dx, ymin - dy, xmax + dx, ymax + dy
+
+    def is_visible(self, cpt, bbox):
+
+        if bbox is None or cpt not in self.cpt_index:
+            return True
+
+        xmin, ymin, xmax, ymax = bbox
+        xmin1, ymin1, xmax1, ymax1 = self.cpt_index.bbox(cpt)
+        return (xmin1 <= xmax and xmax1 >= xmin and
+                ymin1 <= ymax and ymax1 >= ymin)
+
+    def cpt_cull(self, cpt):
+        """Do not draw the component until it comes into view.  Any
+        artists drawn for the component have already been undrawn or
+        removed by clearing the axes."""
+
+        self.cpt_index_update(cpt)
+        self.culled[cpt] = True
+        gcpt = getattr(cpt, 'gcpt', None)
+        if gcpt is not None:
+            gcpt.forget_drawn()
+
     def redraw(self):
 
+        self.dirty_cpts = {}
+        self.dirty_nodes = {}
+        self.cpt_index.clear()
+        self.cpt_table.clear()
+        self.pin_index.clear()
+        self.pin_keys = {}
+        self.stale_cpts = {}
+        self.culled = {}
+
+        bbox = self.view_bbox()
+
         for cpt in self.circuit.elements.values():
-            if cpt == self.selected:
+            self.cpt_index_update(cpt)
+            if not self.is_visible(cpt, bbox):
+                self.cpt_cull(cpt)
+            elif cpt == self.selected:
                 self.cpt_draw(cpt, color=self.preferences.color('select'))
             else:
                 self.cpt_draw(cpt)
 
         # Should redraw nodes on top to blank out wires on top of ports
 
+    def redraw_dirty(self):
+        """Undraw and redraw the components marked as dirty, with their
+        annotations and node markers.  The other artists are left
+        alone."""
+
+        cpts = dict(self.dirty_cpts)
+        for node in self.dirty_nodes:
+            # The node may have since been renamed or merged.
+            for node1 in (node, self.circuit.nodes.get(node.name)):
+                if node1 is None:
+                    continue
+                for cpt in node1.connected:
+                    cpts[cpt] = True
+
+        self.dirty_cpts = {}
+        self.dirty_nodes = {}
+
+        for cpt in cpts:
+            gcpt = getattr(cpt, 'gcpt', None)
+            if gcpt is None:
+                continue
+            if cpt in self.culled:
+                # Nothing is drawn but the nodes may have moved.
+                gcpt.update()
+            else:
+                gcpt.undraw()
+
+        bbox = self.view_bbox()
+
+        for cpt in cpts:
+            # Skip components that have been deleted or remade.
+            if self.circuit.elements.get(cpt.name) is not cpt:
+                self.cpt_index_remove(cpt)
+                self.culled.pop(cpt, None)
+                continue
+            self.cpt_index_update(cpt)
+            if not self.is_visible(cpt, bbox):
+                self.cpt_cull(cpt)
+            elif cpt == self.selected:
+                self.cpt_draw(cpt, color=self.preferences.color('select'))
+            else:
+                self.cpt_draw(cpt)
+
+    def redraw_visible(self):
+        """Draw the components that have come into view after the view
+        has changed."""
+
+        bbox = self.view_bbox()
+        if bbox is None:
+            cpts = list(self.culled)
+        else:
+            cpts = [cpt for cpt in self.cpt_index.query(bbox)
+                    if cpt in self.culled]
+
+        for cpt in cpts:
+            if cpt == self.selected:
+                self.cpt_draw(cpt, color=self.preferences.color('select'))
+            else:
+                self.cpt_draw(cpt)
+
+    def labels_hide(self):
+        """Hide the component and node labels, if enabled in the
+        preferences, while the schematic is being dragged or panned."""
+
+        if self.labels_hidden or self.preferences.hide_labels != 'true':
+            return
+        self.labels_set_visible(False)
+        self.labels_hidden = True
+
+    def labels_show(self):
+        """Show the labels hidden by `labels_hide()`.  This returns True
+        if the labels were hidden."""
+
+        if not self.labels_hidden:
+            return False
+        self.labels_set_visible(True)
+        self.labels_hidden = False
+        return True
+
+    def labels_set_visible(self, visible):
+
+        for cpt in self.circuit.elements.values():
+            gcpt = getattr(cpt, 'gcpt', None)
+            if gcpt is None:
+                continue
+            for ann in gcpt.annotations:
+                ann.set_visible(visible)
+
+    def restyle(self):
+        """Change the component sketches to the current drawing style.
+        The drawn artists are updated in place; components that cannot
+        be updated in place are redrawn."""
+
+        for cpt in self.circuit.elements.values():
+            try:
+                gcpt = cpt.gcpt
+            except AttributeError:
+                continue
+            if gcpt is None or gcpt.restyle(self):
+                continue
+
+            gcpt.undraw()
+            if cpt == self.selected:
+                self.cpt_draw(cpt, color=self.preferences.color('select'))
+            else:
+                self.cpt_draw(cpt)
+
     def undo(self):
 
         if self.undo_buffer == []:
@@ -5,7 +5,7 @@ from copy import copy
 from lcapygui.ui.cross_hair import CrossHair
 from lcapygui.ui.tk.menu_popup import MenuPopup, MenuDropdown
 from lcapygui.ui.uimodelbase import Thing
-from numpy import sqrt
+from numpy import sqrt, isclose
 
 from lcapy import Circuit
 from lcapy.mnacpts import Cpt
@@ -93,6 +93,11 @@ class UIModelDnD(UIModelBase):
         self.last_pos = None
         self.cursors = Cursors()
         self.node_cursor = None
+        # True when an update of the view for a change of the axes
+        # limits is waiting for Tk to be idle
+        self.view_change_pending = False
+        # True while a mouse button is pressed
+        self.interacting = False
 
         self.key_bindings = {
             'ctrl+c': self.on_copy,
@@ -279,12 +284,13 @@ class UIModelDnD(UIModelBase):
         cpt: lcapy.mnacpts.Cpt or None
             the closest component to (x,y) or None if no component is close
         """
-        for cpt in self.circuit.elements.values():
-            gcpt = cpt.gcpt
-            if gcpt is None:
-                continue
+        cpts = self.cpts_near(x, y)
+        if cpts == []:
+            return None
 
-            if gcpt.is_within_bbox(x, y):
+        within = self.cpt_table.contains_point(cpts, x, y)
+        for cpt, hit in zip(cpts, within):
+            if hit:
                 return cpt
 
         return None
@@ -307,12 +313,16 @@ class UIModelDnD(UIModelBase):
         x2 = self.cursors[1].x
         y2 = self.cursors[1].y
 
-        for cpt in self.circuit.elements.values():
-            if cpt is self:
-                continue
-            gcpt = cpt.gcpt
-            if (gcpt.distance_from_cpt(x1, y1) < 0.2
-                and gcpt.distance_from_cpt(x2, y2) < 0.2):
+        cpts = self.cpts_near(x1, y1, 0.2)
+        if cpts == []:
+            return None
+
+        distances1 = self.cpt_table.segment_distances(cpts, x1, y1)
+        distances2 = self.cpt_table.segment_distances(cpts, x2, y2)
+        for cpt, d1, d2 in zip(cpts, distances1, distances2):
+            # The components with nodes that are not drawn are ignored.
+            if (d1 < 0.2 and d2 < 0.2 and cpt.gcpt.node1.is_drawn
+                    and cpt.gcpt.node2.is_drawn):
                 return cpt
         return None
 
@@ -568,6 +578,7 @@ class UIModelDnD(UIModelBase):
         xmin, ymin, xmax, ymax = bbox
 
         self.ui.set_view(xmin - 2, ymin - 2, xmax + 2, ymax + 2)
+        self.redraw_visible()
         self.ui.refresh()
 
     def on_centre_fit(self):
@@ -585,6 +596,7 @@ class UIModelDnD(UIModelBase):
         ymax = yc + self.preferences.ysize / 2
 
         self.ui.set_view(xmin, ymin, xmax, ymax)
+        self.redraw_visible()
         self.ui.refresh()
 
     def on_clone(self):
@@ -621,24 +633,24 @@ class UIModelDnD(UIModelBase):
     def on_cpt_changed(self, cpt_or_node):
 
         self.invalidate()
-        # Component name may have changed
-        self.clear()
 
         if isinstance(cpt_or_node, Cpt):
 
             # If kind has changed need to remake the sketch
             # and remake the cpt.
             # If name changed need to remake the cpt.
-            self.cpt_remake(cpt_or_node)
+            self.mark_dirty(cpt_or_node)
+            newcpt = self.cpt_remake(cpt_or_node)
+            if newcpt is not None:
+                self.mark_dirty(newcpt)
+                if self.selected is cpt_or_node:
+                    self.selected = newcpt
         elif isinstance(cpt_or_node, Node):
-            # Node name may have changed...
-            pass
-        else:
-            pass
+            # Node name may have changed; this is labelled by the
+            # connected components.
+            self.mark_dirty(cpt_or_node)
 
-        self.redraw()
-        self.cursors.draw()
-        self.ui.refresh()
+        self.on_redraw_dirty()
 
     def on_create_state_space(self):
 
@@ -684,7 +696,10 @@ class UIModelDnD(UIModelBase):
         s += '\nRedo_Buffer.........\n'
         s += str(self.redo_buffer) + '\n'
         s += '\nHistory.........\n'
-        s += str(self.history)
+        s += str(self.history) + '\n'
+        s += '\nSketches (path data, including mapped).........\n'
+        for style, nbytes in self.ui.sketchlib.nbytes().items():
+            s += '%s: %.1f kB\n' % (style, nbytes / 1024)
         self.ui.show_message_dialog(s, 'Debug')
 
     def on_delete(self):
@@ -697,8 +712,7 @@ class UIModelDnD(UIModelBase):
             return
 
         self.delete(self.selected)
-        self.on_redraw()
-        self.ui.refresh()
+        self.on_redraw_dirty()
 
     def on_describe(self):
 
@@ -869,8 +883,15 @@ class UIModelDnD(UIModelBase):
             self.create_component_between_cursors()
             self.crosshair.thing = None
             self.cursors.remove()
+            # The new component is selected; the components sharing
+            # its nodes may need their node markers redrawn.
+            if self.cpt_selected:
+                for node in self.selected.nodes:
+                    self.mark_dirty(node)
 
-        self.on_redraw()
+        # The previously and newly selected components have been
+        # marked dirty by select.
+        self.on_redraw_dirty()
 
     def on_left_double_click(self, x, y):
 
@@ -1021,6 +1042,7 @@ class UIModelDnD(UIModelBase):
             return
 
         node.rename(new_name)
+        self.invalidate()
 
         for cpt in node.connected:
             gcpt = cpt.gcpt
@@ -1028,6 +1050,9 @@ class UIModelDnD(UIModelBase):
                 if node1.name == node.name:
                     gcpt.nodes[m] = node
 
+        # The node markers for the joined node may have changed.
+        self.mark_dirty(node)
+
     def node_drag(self, node, mouse_x, mouse_y, key):
 
         if not self.dragged:
@@ -1109,6 +1134,8 @@ class UIModelDnD(UIModelBase):
 
             self.node_move(gcpt.node2, mouse_x, mouse_y)
             self.new_cpt.nodes[1].pos = gcpt.node2.pos
+            self.node_index_update(self.new_cpt.nodes[1])
+            self.ui.invalidate_background()
             return
 
         thing = self.crosshair.thing
@@ -1137,18 +1164,24 @@ class UIModelDnD(UIModelBase):
 
             # Clear cursors, as we don't need them when placing a component
             self.cursors.remove()
+            self.ui.invalidate_background()
             return
 
         if not self.selected:
             return
 
         self.cursors.remove()
+        self.labels_hide()
 
         if self.cpt_selected:
             self.cpt_drag(self.selected, mouse_x, mouse_y, key)
         else:
             self.node_drag(self.selected, mouse_x, mouse_y, key)
 
+        # The scene has changed so the crosshair update that follows
+        # redraws everything rather than blitting over a stale background.
+        self.ui.invalidate_background()
+
     def on_mouse_scroll(self, scroll_direction, mouse_x, mouse_y):
         """
         Performs operations on mouse scroll
@@ -1171,7 +1204,7 @@ class UIModelDnD(UIModelBase):
             angle = 90 if scroll_direction == 'up' else -90
             self.rotate(self.selected, angle)
             self.selected.gcpt.undraw()
-            self.selected.gcpt.draw(self)
+            self.gcpt_draw(self.selected.gcpt)
 
     def on_mouse_release(self, key=None):
         """
@@ -1232,14 +1265,44 @@ class UIModelDnD(UIModelBase):
             self.undo_buffer.append(ActionMove(info1.cpts,
                                                      from_nodes, to_nodes))
 
-        # Redraw screen for accurate display of labels
-        self.on_redraw()
+        # Redraw the moved components for accurate display of labels
+        self.labels_show()
+        self.on_redraw_dirty()
         self.dragged = False
 
+    def on_interaction_start(self):
+        """This is called when a mouse button is pressed."""
+
+        self.interacting = True
+
+    def on_interaction_end(self):
+        """This is called when a mouse button is released to show the
+        labels hidden while dragging or panning."""
+
+        self.interacting = False
+        if self.labels_show():
+            self.ui.refresh()
+
 
     def on_mouse_zoom(self, ax):
         """This is called whenever xlim or ylim changes; usually
-        in response to selecting area with the mouse to zoom."""
+        in response to selecting area with the mouse to zoom.  Both
+        limits usually change together so the view is updated once,
+        when Tk is next idle."""
+
+        if self.view_change_pending:
+            return
+        self.view_change_pending = True
+        self.ui.after_idle(self.on_view_change, ax)
+
+    def on_view_change(self, ax):
+        """Update the drawing for the current axes limits.  For a pan,
+        only the components that have come into view are drawn.  For
+        a zoom, the font sizes and line widths of the drawn artists
+        are scaled; the drawing is only redrawn if the level of detail
+        changes."""
+
+        self.view_change_pending = False
 
         xlim = ax.get_xlim()
         ylim = ax.get_ylim()
@@ -1248,13 +1311,35 @@ class UIModelDnD(UIModelBase):
         xsize = self.preferences.xsize
         ysize = self.preferences.ysize
         R = sqrt(xsize ** 2 + ysize ** 2)
-        self.zoom_factor = R / r
+        zoom_factor = R / r
+
+        if self.interacting and self.get_navigate_mode() == 'PAN':
+            # The labels are shown when the mouse button is released.
+            self.labels_hide()
+
+        if isclose(zoom_factor, self.zoom_factor):
+            # The view has been panned so only the components that
+            # have come into view need drawing.
+            self.redraw_visible()
+            return
+
+        scale = zoom_factor / self.zoom_factor
+        self.zoom_factor = zoom_factor
 
         if self.ui.debug:
             print('zoom %s' % self.zoom_factor)
 
-        self.clear()
-        self.redraw()
+        lod = self.lod_for_zoom(zoom_factor)
+        if lod != self.lod:
+            if self.ui.debug:
+                print('level of detail %s' % lod)
+            self.lod = lod
+            self.clear()
+            self.redraw()
+        else:
+            self.ui.sketcher.rescale(scale)
+            # Zooming out may bring culled components into view.
+            self.redraw_visible()
 
         # Don't refresh; will keep the old axes size
         # self.ui.refresh()
@@ -1320,6 +1405,7 @@ class UIModelDnD(UIModelBase):
 
         for old_node, new_node in zip(old_nodes, new_cpt.nodes):
             new_node.pos = copy(old_node.pos)
+        self.invalidate()
 
         # Update gcpt nodes
         gcpt.update(nodes=new_cpt.nodes)
@@ -1359,8 +1445,22 @@ class UIModelDnD(UIModelBase):
 
     def on_preferences(self):
 
+        drawn = dict(vars(self.preferences))
+
         def update():
-            self.on_redraw()
+            changed = [key for key, value in vars(self.preferences).items()
+                       if drawn.get(key) != value]
+            drawn.update(vars(self.preferences))
+
+            redraw = [key for key in changed if key != 'style' and
+                      key not in self.preferences.not_drawn]
+            if redraw != []:
+                self.on_redraw()
+            elif 'style' in changed:
+                # The sketches for all the styles are kept loaded so
+                # switching style does not need a full redraw.
+                self.restyle()
+                self.ui.refresh()
             # Handle current_sign_convention
             self.invalidate()
             self.preferences.apply()
@@ -1380,7 +1480,7 @@ class UIModelDnD(UIModelBase):
     def on_redo(self):
 
         self.redo()
-        self.ui.refresh()
+        self.on_redraw_dirty()
 
     def on_redraw(self):
         """
@@ -1392,6 +1492,15 @@ class UIModelDnD(UIModelBase):
         self.cursors.draw()
         self.ui.refresh()
 
+    def on_redraw_dirty(self):
+        """
+        Redraws the components that have been moved, edited, or
+        selected or unselected
+
+        """
+        self.redraw_dirty()
+        self.ui.refresh()
+
     def on_resize(self):
 
         if self.ui.debug:
@@ -1498,14 +1607,14 @@ class UIModelDnD(UIModelBase):
 
         if cpt:
             self.select(cpt)
-            # TODO: only redraw selected component
-            # Redraw to highlight selected component
-            self.on_redraw()
         elif node:
             self.select(node)
         else:
             self.select(None)
 
+        # Redraw the selected and unselected components
+        self.on_redraw_dirty()
+
     def on_show_new_circuit(self, cct):
 
         model = self.ui.new()
@@ -1525,7 +1634,7 @@ class UIModelDnD(UIModelBase):
     def on_undo(self):
 
         self.undo()
-        self.on_redraw()
+        self.on_redraw_dirty()
 
     def on_unselect(self):
 
@@ -1561,9 +1670,11 @@ class UIModelDnD(UIModelBase):
 
     def unselect(self):
 
+        if isinstance(self.selected, Cpt):
+            self.mark_dirty(self.selected)
         self.selected = None
         self.crosshair.thing = None
         self.crosshair.undraw()
         self.cursors.remove()
-        self.redraw()
+        self.redraw_dirty()
         self.ui.refresh()
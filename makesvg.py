@@ -1,6 +1,16 @@
 from lcapygui.ui.uimodelbase import UIModelBase
 from lcapygui.core.sketch import Sketch
 from lcapygui.core.cpt_maker import gcpt_make_from_type
+from lcapygui.core.sketch_bundle import SketchBundle
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import sha1
+from json import dump, load
+from os.path import exists, join
+from numpy import array_equal
+
+# This records, for each style and sketch key, a hash of the sketch
+# net, style, and Circuitikz version used to create the SVG file.
+MANIFEST_FILENAME = join('lcapygui', 'data', 'svg', 'manifest.json')
 
 
 def cpt_sketch_make(cpt, dstyle):
@@ -8,11 +18,11 @@ def cpt_sketch_make(cpt, dstyle):
     Sketch.create(cpt.sketch_key, cpt.sketch_net, dstyle)
 
 
-def make1(thing, dstyle):
+def gcpts1(thing):
+    """Generate the graphical components to make for a thing."""
 
     gcpt = gcpt_make_from_type(thing.cpt_type, kind=thing.kind)
-    print(gcpt.sketch_key, '\t', gcpt.sketch_net)
-    cpt_sketch_make(gcpt, dstyle)
+    yield gcpt
 
     if thing.kind:
         # Don't make other connections; make_connections
@@ -23,15 +33,18 @@ def make1(thing, dstyle):
     styles = gcpt.styles
     for kind in kinds:
         if styles == {}:
-            gcpt = gcpt_make_from_type(thing.cpt_type, kind=kind)
-            print(gcpt.sketch_key, '\t', gcpt.sketch_net)
-            cpt_sketch_make(gcpt, dstyle)
+            yield gcpt_make_from_type(thing.cpt_type, kind=kind)
         else:
             for style in styles:
-                gcpt = gcpt_make_from_type(
+                yield gcpt_make_from_type(
                     thing.cpt_type, kind=kind, style=style)
-                print(gcpt.sketch_key, '\t', gcpt.sketch_net)
-                cpt_sketch_make(gcpt, dstyle)
+
+
+def make1(thing, dstyle):
+
+    for gcpt in gcpts1(thing):
+        print(gcpt.sketch_key, '\t', gcpt.sketch_net)
+        cpt_sketch_make(gcpt, dstyle)
 
 
 def make(thing):
@@ -62,10 +75,156 @@ def make_cpt(cpt_type):
     make(UIModelBase.component_map[cpt_type])
 
 
-def make_all():
+def make_bundles():
+
+    for dstyle in ('american', 'british', 'european'):
+        filename = SketchBundle.build(dstyle)
+        print('Created', filename)
+
+
+def circuitikz_version():
+
+    from lcapy.system import LatexRunner
+
+    date, version = LatexRunner().find_circuitikz_version()
+    return '%s (%s)' % (version, date)
+
+
+def sketch_hash(sketch_net, dstyle, version):
+
+    s = '\n'.join((sketch_net, dstyle, version))
+    return sha1(s.encode('utf-8')).hexdigest()
+
+
+def load_manifest():
+
+    if not exists(MANIFEST_FILENAME):
+        return {}
+
+    with open(MANIFEST_FILENAME) as f:
+        return load(f)
+
+
+def save_manifest(manifest):
+
+    with open(MANIFEST_FILENAME, 'w') as f:
+        dump(manifest, f, indent=1, sort_keys=True)
+        f.write('\n')
+
+
+def sketch_jobs():
+    """Return dict of sketch nets indexed by (style, sketch key) for
+    all the connections and components."""
+
+    jobs = {}
+    things = list(UIModelBase.connection_map.values()) + \
+        list(UIModelBase.component_map.values())
+
+    for thing in things:
+        if thing.cpt_type == 'DW':
+            continue
+        for gcpt in gcpts1(thing):
+            if gcpt.sketch_net is None:
+                continue
+            for dstyle in ('american', 'british', 'european'):
+                jobs[(dstyle, gcpt.sketch_key)] = gcpt.sketch_net
+    return jobs
+
+
+def same_geometry(sketch1, sketch2):
+
+    if (sketch1.width, sketch1.height) != (sketch2.width, sketch2.height):
+        return False
+
+    for array1, array2 in zip(sketch1.stacked, sketch2.stacked):
+        if not array_equal(array1, array2):
+            return False
+    return True
+
+
+def make_sketch(dstyle, sketch_key, sketch_net):
+    """Create the SVG file for a sketch and return 'new', 'changed', or
+    'unchanged' depending on how its geometry has changed."""
+
+    svg_filename = join('lcapygui', 'data', 'svg', dstyle,
+                        sketch_key + '.svg')
+
+    old = None
+    if exists(svg_filename):
+        old = Sketch.load_file(svg_filename)
+
+    Sketch.create(sketch_key, sketch_net, dstyle)
+
+    if old is None:
+        return 'new'
+
+    new = Sketch.load_file(svg_filename)
+    if same_geometry(old, new):
+        return 'unchanged'
+    return 'changed'
+
+
+def make_all(force=False, max_workers=None):
+    """Make the SVG files for all the components in all the styles.
+    Only the sketches whose net, style, or the Circuitikz version have
+    changed since they were last made are made, unless `force` is True.
+    The sketches are made in parallel using `max_workers` processes
+    (default the number of CPUs)."""
+
+    version = circuitikz_version()
+    print('Circuitikz version', version)
+
+    manifest = load_manifest()
+    if manifest.get('circuitikz') != version:
+        print('Circuitikz version changed from', manifest.get('circuitikz'))
+
+    hashes = manifest.get('sketches', {})
+
+    jobs = {}
+    for (dstyle, sketch_key), sketch_net in sketch_jobs().items():
+        key = dstyle + '/' + sketch_key
+        svg_filename = join('lcapygui', 'data', 'svg', dstyle,
+                            sketch_key + '.svg')
+        if (not force and exists(svg_filename) and
+                hashes.get(key) == sketch_hash(sketch_net, dstyle, version)):
+            continue
+        jobs[key] = (dstyle, sketch_key, sketch_net)
+
+    print('Making %d sketches' % len(jobs))
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {key: executor.submit(make_sketch, *job)
+                   for key, job in jobs.items()}
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                print('Failed to make %s: %s' % (key, e))
+                continue
+
+            dstyle, sketch_key, sketch_net = jobs[key]
+            hashes[key] = sketch_hash(sketch_net, dstyle, version)
+            print(key, '\t', results[key])
+
+    manifest['circuitikz'] = version
+    manifest['sketches'] = hashes
+    save_manifest(manifest)
 
-    make_connections()
-    make_components()
+    changed = [key for key, result in results.items() if result != 'unchanged']
+    if changed != []:
+        print('Geometry changed for:')
+        for key in sorted(changed):
+            print('  %s (%s)' % (key, results[key]))
+    else:
+        print('No geometry changed')
+
+    if results != {}:
+        # The bundles record a hash of each SVG file so need
+        # rebuilding even if the geometry is unchanged.
+        make_bundles()
+
+    return results
 
 # make_all()
 
@@ -48,6 +48,6 @@ setup(
         ],
     },
     include_package_data=True,
-    package_data={'': ['data/svg/*/*.svg', 'data/lib/*/*.sch', 'data/icon/*']},
+    package_data={'': ['data/svg/*/*.svg', 'data/svg/*/*.bundle', 'data/lib/*/*.sch', 'data/icon/*']},
     python_requires=">=3.7"  # matched with lcapy
 )